@@ -140,6 +140,25 @@ def remove_suffix(text: str, suffix: str | list[Any], ignore_case: bool = False)
     return text
 
 
+def normalize_newlines(content: str) -> str:
+    """
+    Collapse runs of three or more newlines down to two.
+
+    Args:
+        content: Rendered template content to normalize
+
+    Returns:
+        Content with at most two consecutive newlines
+
+    Examples:
+        >>> normalize_newlines("foo\\n\\n\\nbar")
+        'foo\\n\\nbar'
+    """
+    while "\n\n\n" in content:
+        content = content.replace("\n\n\n", "\n\n")
+    return content
+
+
 # Operation type enumeration for artifact processing
 class OperationType(Enum):
     """Enumeration of artifact operation types based on file combinations."""
@@ -1186,9 +1205,7 @@ class ArtifactEngine:
             >>> _normalize_newlines("foo\\n\\n\\n\\nbar")  # 4 newlines -> 2
             'foo\\n\\nbar'
         """
-        while "\n\n\n" in content:
-            content = content.replace("\n\n\n", "\n\n")
-        return content
+        return normalize_newlines(content)
 
     def _compile_jsonnet(
         self,
@@ -8,7 +8,8 @@ following the Dependency Inversion Principle.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+import os
 from pathlib import Path
 
 
@@ -76,6 +77,23 @@ class FileSystem:
         path_obj = Path(path) if isinstance(path, str) else path
         path_obj.write_text(content, encoding=encoding)
 
+    def write_many(
+        self, entries: Iterable[tuple[Path | str, str]], encoding: str = "utf-8"
+    ) -> None:
+        """Write several text files in one call.
+
+        Args:
+            entries: (path, content) pairs to write, in order
+            encoding: Text encoding to use (default: utf-8)
+
+        Raises:
+            PermissionError: If write access is denied
+            FileNotFoundError: If a parent directory doesn't exist
+            UnicodeEncodeError: If encoding fails
+        """
+        for path, content in entries:
+            self.write_text(path, content, encoding=encoding)
+
     def append_text(
         self, path: Path | str, content: str, encoding: str = "utf-8"
     ) -> None:
@@ -107,6 +125,22 @@ class FileSystem:
         path_obj = Path(path) if isinstance(path, str) else path
         return path_obj.exists()
 
+    def find_marker(self, directory: Path | str, name: str) -> bool:
+        """Check whether a directory directly contains an entry with the given name.
+
+        Uses a single stat of the joined path, so the cost does not grow with
+        the size of the directory and directories that can be searched but not
+        listed are handled the same way as exists().
+
+        Args:
+            directory: Directory to look in
+            name: Exact entry name to look for
+
+        Returns:
+            True if an entry with that name exists, False otherwise
+        """
+        return os.path.exists(os.path.join(directory, name))
+
     def mkdir(
         self, path: Path | str, parents: bool = False, exist_ok: bool = False
     ) -> None:
@@ -8,8 +8,14 @@ the Artifact Engine cannot perform I/O operations.
 from __future__ import annotations
 
 from pathlib import Path
+import re
 from typing import Any
 
+# Absolute on any platform: a drive root, a leading separator (including UNC
+# "//server"), or a home-directory prefix. Matched against the forward-slash
+# string form, so Windows-style paths are rejected on every host.
+_ABSOLUTE_PATH_RE = re.compile(r"^(?:[A-Za-z]:/|/|~(?:/|$))")
+
 
 class PantheonPath:
     """Protection proxy that wraps pathlib.Path while preventing I/O operations.
@@ -25,8 +31,18 @@ class PantheonPath:
 
     Only authorized components like the Workspace can unwrap the underlying
     Path object to perform actual I/O operations.
+
+    The string form and parts are computed once at construction, since
+    instances are immutable and both are read repeatedly by validators.
+
+    "Relative" is stricter than Path.is_absolute(): drive-letter paths such
+    as "C:/x", "~" and "~/x" are rejected on every platform, even though a
+    POSIX Path treats them as relative. This is a deliberate tightening so
+    that validation does not depend on the host OS.
     """
 
+    __slots__ = ("_path", "_str", "_parts")
+
     def __init__(self, *args: str) -> None:
         """Create a PantheonPath from string path segments only.
 
@@ -55,12 +71,15 @@ class PantheonPath:
 
         # Create the path and validate it's relative (per T015 requirement)
         self._path = Path(*args)
+        self._str = str(self._path).replace("\\", "/")
 
-        if self._path.is_absolute():
+        if _ABSOLUTE_PATH_RE.match(self._str):
             raise ValueError(
                 f"PantheonPath must represent a relative path, got absolute path: {self._path}"
             )
 
+        self._parts = self._path.parts
+
     @property
     def name(self) -> str:
         """The final component of the path."""
@@ -84,7 +103,7 @@ class PantheonPath:
     @property
     def parts(self) -> tuple[str, ...]:
         """A tuple giving access to the path's various components."""
-        return self._path.parts
+        return self._parts
 
     def joinpath(self, *args: str | PantheonPath) -> PantheonPath:
         """Combine this path with one or more other path components.
@@ -193,7 +212,7 @@ class PantheonPath:
             String representation of the underlying path using forward slashes
             for cross-platform consistency
         """
-        return str(self._path).replace("\\", "/")
+        return self._str
 
     def __repr__(self) -> str:
         """Return unambiguous string representation of the PantheonPath.
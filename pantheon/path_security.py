@@ -5,8 +5,12 @@ path manipulation attempts across all framework components.
 """
 
 from pathlib import Path
+import re
 import urllib.parse
 
+# A ".." path component delimited by either separator, whatever the host OS
+_TRAVERSAL_RE = re.compile(r"(?:^|[\\/])\.\.(?:[\\/]|$)")
+
 
 class PathSecurityError(ValueError):
     """Raised when a path fails security validation."""
@@ -43,33 +47,34 @@ def validate_path_safety(
     if not path_str:
         raise PathSecurityError(f"Empty {context} not allowed")
 
-    # Decode URL-encoded sequences to catch encoded traversal attempts
-    try:
-        decoded_path = urllib.parse.unquote(path_str)
-        # Double decode to catch double-encoded attempts
-        double_decoded_path = urllib.parse.unquote(decoded_path)
-    except Exception:
-        # If decoding fails, continue with original path
-        decoded_path = path_str
-        double_decoded_path = path_str
-
     # Check for directory traversal in path components
-    # We check the path components (parts) to avoid false positives with
-    # filenames containing multiple dots like "file...txt"
-    path_obj = Path(path_str)
-    if ".." in path_obj.parts:
+    # The pattern only matches ".." as a whole component, avoiding false
+    # positives with filenames containing multiple dots like "file...txt".
+    # The original string is checked first, then the decoded forms. Plain
+    # substring tests skip the regex and the decoding for the common case of
+    # a path with no ".." and no percent-escapes.
+    if ".." in path_str and _TRAVERSAL_RE.search(path_str):
         raise PathSecurityError(
             f"Directory traversal not allowed in {context}: {path_str}"
         )
 
-    # Also check decoded paths for traversal sequences
-    decoded_obj = Path(decoded_path)
-    double_decoded_obj = Path(double_decoded_path)
-
-    if ".." in decoded_obj.parts or ".." in double_decoded_obj.parts:
-        raise PathSecurityError(
-            f"Directory traversal not allowed in {context}: {path_str}"
-        )
+    if "%" in path_str:
+        # Decode URL-encoded sequences to catch encoded traversal attempts
+        try:
+            decoded_path = urllib.parse.unquote(path_str)
+            # Double decode to catch double-encoded attempts
+            double_decoded_path = urllib.parse.unquote(decoded_path)
+        except Exception:
+            # If decoding fails, continue with original path
+            decoded_path = path_str
+            double_decoded_path = path_str
+
+        if _TRAVERSAL_RE.search(decoded_path) or _TRAVERSAL_RE.search(
+            double_decoded_path
+        ):
+            raise PathSecurityError(
+                f"Directory traversal not allowed in {context}: {path_str}"
+            )
 
     # Check for absolute paths (unless explicitly allowed)
     if not allow_absolute:
@@ -86,7 +91,7 @@ def validate_path_safety(
             )
 
         # Also check using pathlib for cross-platform safety
-        if path_obj.is_absolute():
+        if Path(path_str).is_absolute():
             raise PathSecurityError(
                 f"Absolute paths not allowed in {context}: {path_str}"
             )
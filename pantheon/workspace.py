@@ -24,16 +24,27 @@ Key Responsibilities:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import Enum
+import functools
+import os
 from pathlib import Path
 import re
-from typing import Any, TypedDict
+from types import MappingProxyType
+from typing import Any, ClassVar, TypedDict
 import uuid
+import weakref
 
 import jinja2
 import yaml
 
-from pantheon.artifact_engine import remove_suffix, slugify
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+from pantheon.artifact_engine import normalize_newlines, remove_suffix, slugify
 from pantheon.filesystem import FileSystem
 from pantheon.logger import Log
 from pantheon.path import PantheonPath
@@ -117,6 +128,133 @@ class ArtifactUpdate(Enum):
 PROCESS_URI_PREFIX = "process://"
 
 
+# Project root discovery memo, held weakly per FileSystem instance so a fresh
+# FileSystem (one per CLI invocation) always starts from a cold cache. Maps a
+# visited directory to the nearest project root at or above it, or None when
+# the walk from that directory reached the filesystem root without a marker.
+_DISCOVERY_CACHE: weakref.WeakKeyDictionary[FileSystem, dict[str, str | None]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def clear_discovery_cache() -> None:
+    """Forget all memoized project root discovery results."""
+    _DISCOVERY_CACHE.clear()
+
+
+# Parsed .pantheon_project configurations, held weakly per FileSystem instance
+# and keyed by resolved project root. Only successfully parsed files are kept;
+# defaults for a missing or malformed file are recomputed on every call.
+_CONFIG_CACHE: weakref.WeakKeyDictionary[FileSystem, dict[str, ProjectConfig]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def invalidate_project_config(filesystem: FileSystem | None = None) -> None:
+    """Forget memoized project configurations.
+
+    Args:
+        filesystem: Only forget configurations read through this FileSystem.
+            If None, forget all memoized configurations.
+    """
+    if filesystem is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(filesystem, None)
+
+
+# Routine templates whose only Jinja syntax is bare ``{{ name }}`` placeholders
+# are substituted directly instead of compiling a Jinja template.
+_JINJA_BLOCK_OR_COMMENT = re.compile(r"{%|{#")
+_JINJA_SIMPLE_PLACEHOLDER = re.compile(r"{{\s*([A-Za-z_][A-Za-z0-9_]*)\s*}}")
+
+
+def _render_simple(template: str, params: dict[str, Any]) -> str | None:
+    """Substitute bare ``{{ name }}`` placeholders without invoking Jinja.
+
+    Output matches ArtifactEngine.render_template: newlines are normalized the
+    same way, and templates referencing a name missing from ``params`` are left
+    to the engine so its undefined-variable warnings still fire.
+
+    Args:
+        template: Template text to render
+        params: Values for the placeholders
+
+    Returns:
+        Rendered text, or None if the template needs full Jinja: it uses any
+        other Jinja syntax (blocks, comments, filters, attribute access) or an
+        undefined placeholder
+    """
+    if _JINJA_BLOCK_OR_COMMENT.search(template) is not None:
+        return None
+    names = _JINJA_SIMPLE_PLACEHOLDER.findall(template)
+    if template.count("{{") != len(names):
+        return None
+    if any(name not in params for name in names):
+        return None
+
+    rendered = _JINJA_SIMPLE_PLACEHOLDER.sub(
+        lambda match: str(params[match.group(1)]), template
+    )
+    return normalize_newlines(rendered)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_artifact_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile an artifact filename pattern, reusing earlier compilations.
+
+    Invalid patterns raise re.error and are not cached.
+    """
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_semantic_uri_impl(
+    uri: str,
+) -> tuple[str, str, str | None, tuple[tuple[str, str], ...]]:
+    """Parse a semantic URI, reusing earlier results for the same string.
+
+    Parameters come back as a tuple of (key, value) pairs so the cached value
+    stays immutable. Invalid URIs raise ValueError and are not cached.
+    """
+    if "://" not in uri:
+        raise ValueError(f"Invalid semantic URI format (missing ://): {uri}")
+
+    scheme, rest = uri.split("://", 1)
+
+    if not scheme:
+        raise ValueError(f"Invalid semantic URI format (empty scheme): {uri}")
+    if not rest:
+        raise ValueError(f"Invalid semantic URI format (missing process name): {uri}")
+
+    # Parse query parameters first
+    if "?" in rest:
+        path_part, query_string = rest.split("?", 1)
+
+        # Parse query parameters
+        parameters = {}
+        if query_string:
+            for param_pair in query_string.split("&"):
+                if "=" in param_pair:
+                    key, value = param_pair.split("=", 1)
+                    parameters[key] = value
+                else:
+                    # Parameter without value (e.g., ?flag)
+                    parameters[param_pair] = ""
+    else:
+        path_part = rest
+        parameters = {}
+
+    # Parse process name and optional sub-path
+    if "/" in path_part:
+        process_name, sub_path = path_part.split("/", 1)
+    else:
+        process_name = path_part
+        sub_path = None
+
+    return scheme, process_name, sub_path, tuple(parameters.items())
+
+
 class SecurityError(Exception):
     """Raised when a path operation violates security constraints."""
 
@@ -161,9 +299,26 @@ class PantheonWorkspace:
         _project_root: The root directory of the Pantheon project
         _artifacts_root: The sandboxed directory for generated artifacts
         _filesystem: The injected FileSystem dependency for I/O operations
-        _project_config: Configuration from .pantheon_project file
+        _project_config: Read-only view of the .pantheon_project configuration;
+            assigning it recomputes _active_team, _team_root and _processes_root
     """
 
+    # Semantic URI schemes whose content comes from a single-argument
+    # get_* method taking the process name. Schemes that also consume a
+    # sub-path or query parameters are routed in get_resolved_content.
+    _SCHEME_DISPATCH: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "artifact-content-template": "get_artifact_content_template",
+            "artifact-directory-template": "get_artifact_directory_template",
+            "artifact-filename-template": "get_artifact_filename_template",
+            "artifact-locator": "get_artifact_locator",
+            "artifact-parser": "get_artifact_parser",
+            "artifact-section-markers": "get_artifact_section_markers",
+            "process-routine": "get_process_routine",
+            "process-schema": "get_process_schema",
+        }
+    )
+
     def __init__(
         self,
         project_root: str,
@@ -196,12 +351,37 @@ class PantheonWorkspace:
         Log.debug(f"Workspace initialized with _artifacts_root: {self._artifacts_root}")
 
         # Load project configuration to get active_team
-        self._project_config = self.load_project_config(filesystem, project_root)
+        config = self.load_project_config(filesystem, project_root)
         # Normalize audit config defaults
-        if CONFIG_KEY_AUDIT_ENABLED not in self._project_config:
-            self._project_config[CONFIG_KEY_AUDIT_ENABLED] = False
-        if CONFIG_KEY_AUDIT_DIRECTORY not in self._project_config:
-            self._project_config[CONFIG_KEY_AUDIT_DIRECTORY] = DEFAULT_AUDIT_DIRECTORY
+        if CONFIG_KEY_AUDIT_ENABLED not in config:
+            config[CONFIG_KEY_AUDIT_ENABLED] = False
+        if CONFIG_KEY_AUDIT_DIRECTORY not in config:
+            config[CONFIG_KEY_AUDIT_DIRECTORY] = DEFAULT_AUDIT_DIRECTORY
+        self._project_config = config
+
+        # Shared Jinja settings/filters for artifact templates, built on first use
+        self._template_base_env: jinja2.Environment | None = None
+        # Per-process overlays of the shared environment, keyed by (active_team, process)
+        self._env_cache: dict[tuple[str, str], jinja2.Environment] = {}
+        # Existence of redirect.md / parser.jsonnet, keyed by (active_team, process)
+        self._redirect_cache: dict[tuple[str, str], bool] = {}
+        self._parser_cache: dict[tuple[str, str], bool] = {}
+
+    def __copy__(self) -> PantheonWorkspace:
+        """Return a shallow copy with its own configuration and caches.
+
+        Roots, the filesystem and the read-only project configuration are
+        shared with the original. The memoized environments and existence
+        checks start empty, so the copy can be rebound to another filesystem
+        or configuration without reading the original's cached results.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._template_base_env = None
+        clone._env_cache = {}
+        clone._redirect_cache = {}
+        clone._parser_cache = {}
+        return clone
 
     @classmethod
     def discover_project_root(
@@ -224,22 +404,38 @@ class PantheonWorkspace:
         The search traverses up the directory tree from start_path until either
         finding the marker file or reaching the filesystem root. Returns raw
         string paths suitable for passing to the workspace constructor.
-        """
-        from pathlib import Path
 
-        current_path = Path(start_path).resolve()
+        Results are memoized per FileSystem instance: every directory visited
+        during a walk records the outcome, so later discoveries starting from
+        the same directories (or below them) stop at the first known ancestor.
+        Use clear_discovery_cache() to discard memoized results.
+        """
+        walk_cache = _DISCOVERY_CACHE.setdefault(filesystem, {})
+        # Resolve once, then walk plain strings to avoid a Path per level
+        current = os.fspath(Path(start_path).resolve())
+        visited: list[str] = []
+        result: str | None = None
 
         while True:
-            marker_path = current_path / PROJECT_MARKER_FILE
-            if filesystem.exists(marker_path):
-                return str(current_path)
+            if current in walk_cache:
+                result = walk_cache[current]
+                break
+            visited.append(current)
 
-            parent = current_path.parent
-            if parent == current_path:  # Reached filesystem root
+            if filesystem.find_marker(current, PROJECT_MARKER_FILE):
+                result = current
                 break
-            current_path = parent
 
-        return None
+            parent = os.path.dirname(current)
+            if parent == current:  # Reached filesystem root
+                break
+            current = parent
+
+        # Backfill every directory probed on this walk with the outcome
+        for visited_key in visited:
+            walk_cache[visited_key] = result
+
+        return result
 
     @classmethod
     def load_project_config(
@@ -261,7 +457,17 @@ class PantheonWorkspace:
         Raises:
             FileNotFoundError: If .pantheon_project doesn't exist
             ValueError: If configuration is missing required keys
+
+        Successfully parsed configurations are memoized per FileSystem instance
+        and project root; callers always receive their own copy. Use
+        invalidate_project_config() to discard memoized configurations.
         """
+        config_cache = _CONFIG_CACHE.setdefault(filesystem, {})
+        cache_key = str(Path(project_root).resolve())
+        cached = config_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
         config_path = Path(project_root) / PROJECT_MARKER_FILE
 
         if not filesystem.exists(config_path):
@@ -279,7 +485,7 @@ class PantheonWorkspace:
 
         try:
             config_text = filesystem.read_text(config_path)
-            config_data = yaml.safe_load(config_text)
+            config_data = yaml.load(config_text, Loader=_YamlLoader)
 
             # Ensure required keys exist with defaults
             config = ProjectConfig(
@@ -304,7 +510,8 @@ class PantheonWorkspace:
                 if log_level in ["DEBUG", "INFO", "WARNING", "ERROR"]:
                     config["log_level"] = log_level
 
-            return config
+            config_cache[cache_key] = config
+            return config.copy()
         except Exception as e:
             Log.error(f"Failed to load {PROJECT_MARKER_FILE}: {e}")
             # Return defaults on error
@@ -316,12 +523,41 @@ class PantheonWorkspace:
                 temp_file_cleanup=DEFAULT_TEMP_FILE_CLEANUP,
             )
 
+    @property
+    def _project_config(self) -> Mapping[str, Any]:
+        """Read-only view of the configuration from the .pantheon_project file.
+
+        The view cannot be changed in place; assign a new configuration instead
+        so the active team and the values derived from it stay in step.
+        """
+        return self._config
+
+    @_project_config.setter
+    def _project_config(self, config: ProjectConfig) -> None:
+        """Store the configuration and derive everything keyed on the active team.
+
+        The active team is read once here. The team root, its processes
+        directory and the per-process cache keys all come from it, so they
+        cannot disagree. The roots are None when no active team is configured.
+        """
+        self._config: Mapping[str, Any] = MappingProxyType(dict(config))
+        self._active_team: str = config.get("active_team", "")
+        if self._active_team:
+            self._team_root: Path | None = (
+                self._project_root / TEAMS_DIR / self._active_team
+            )
+            self._processes_root: Path | None = self._team_root / PROCESSES_SUBDIR
+        else:
+            self._team_root = None
+            self._processes_root = None
+
     def _get_active_team_root(self) -> Path:
         """Get the absolute path to the active team's directory.
 
-        Computes the sandbox path for the active team based on the
-        pantheon-teams/<active_team>/ convention. This is the boundary
-        for process:// URI resolution.
+        Returns the sandbox path for the active team based on the
+        pantheon-teams/<active_team>/ convention, precomputed when the project
+        configuration was assigned. This is the boundary for process:// URI
+        resolution.
 
         Returns:
             Path object for pantheon-teams/<active_team>/ directory
@@ -329,13 +565,12 @@ class PantheonWorkspace:
         Raises:
             ValueError: If active_team is not set in configuration
         """
-        active_team = self._project_config["active_team"]
-        if not active_team:
+        if self._team_root is None:
             raise ValueError(
                 f"No {CONFIG_KEY_ACTIVE_TEAM} configured in {PROJECT_MARKER_FILE}"
             )
 
-        return self._project_root / TEAMS_DIR / active_team
+        return self._team_root
 
     def save_artifact(
         self,
@@ -366,6 +601,29 @@ class PantheonWorkspace:
         Examples:
             workspace.save_artifact("Hello", PantheonPath("output/test.txt"))
         """
+        absolute_path = self._resolve_artifact_write_path(path)
+
+        # Create parent directories as needed (no-op when they already exist)
+        self._filesystem.mkdir(absolute_path.parent, parents=True, exist_ok=True)
+
+        # Write content through FileSystem dependency
+        self._filesystem.write_text(absolute_path, content)
+
+        return PantheonPath(str(absolute_path.relative_to(self._artifacts_root)))
+
+    def _resolve_artifact_write_path(self, path: PantheonPath) -> Path:
+        """Validate an artifact write target and return its absolute path.
+
+        Args:
+            path: Target path for the artifact within the sandbox
+
+        Returns:
+            Absolute path of the artifact under artifacts_root
+
+        Raises:
+            SecurityError: If path attempts to escape the sandbox or targets the
+                audit directory
+        """
         # Validate path security to prevent traversal attacks
         self._validate_path_security(path)
 
@@ -387,15 +645,7 @@ class PantheonWorkspace:
                 "Invalid artifact path; potential attempt to access audit directory"
             ) from err
 
-        # Create parent directories as needed
-        parent_path = absolute_path.parent
-        if not self._filesystem.exists(parent_path):
-            self._filesystem.mkdir(parent_path, parents=True, exist_ok=True)
-
-        # Write content through FileSystem dependency
-        self._filesystem.write_text(absolute_path, content)
-
-        return PantheonPath(str(absolute_path.relative_to(self._artifacts_root)))
+        return absolute_path
 
     def append_jsonl_entry(
         self,
@@ -450,10 +700,8 @@ class PantheonWorkspace:
                 "Invalid JSONL path; potential attempt to access audit directory"
             ) from err
 
-        # Create parent directories as needed
-        parent_path = absolute_path.parent
-        if not self._filesystem.exists(parent_path):
-            self._filesystem.mkdir(parent_path, parents=True, exist_ok=True)
+        # Create parent directories as needed (no-op when they already exist)
+        self._filesystem.mkdir(absolute_path.parent, parents=True, exist_ok=True)
 
         # Serialize data and append as JSONL entry
         json_line = _json.dumps(data, ensure_ascii=False)
@@ -639,7 +887,7 @@ class PantheonWorkspace:
             # Returns: pantheon-teams/<active_team>/
         """
         if team is None:
-            team = self._project_config["active_team"]
+            team = self._active_team
             if not team:
                 raise ValueError(
                     f"No team specified and no {CONFIG_KEY_ACTIVE_TEAM} configured"
@@ -666,8 +914,11 @@ class PantheonWorkspace:
             _build_process_path("update-plan", "artifact", "finder.jsonnet")
             # Returns: /project/pantheon-teams/active-team/processes/update-plan/artifact/finder.jsonnet
         """
-        team_root = self._get_active_team_root()
-        return team_root / PROCESSES_SUBDIR / process_name / Path(*path_parts)
+        processes_root = self._processes_root
+        if processes_root is None:
+            # Raises the missing active_team error
+            processes_root = self._get_active_team_root() / PROCESSES_SUBDIR
+        return processes_root.joinpath(process_name, *path_parts)
 
     def _build_team_path(self, *path_parts: str) -> Path:
         """Build absolute path within active team directory.
@@ -688,8 +939,7 @@ class PantheonWorkspace:
             _build_team_path("agents", "tech-lead.md")
             # Returns: /project/pantheon-teams/active-team/agents/tech-lead.md
         """
-        team_root = self._get_active_team_root()
-        return team_root / Path(*path_parts)
+        return self._get_active_team_root().joinpath(*path_parts)
 
     # Content-Retrieval Methods
     def get_process_schema(self, process_name: str) -> str:
@@ -879,8 +1129,20 @@ class PantheonWorkspace:
         Examples:
             has_redirect = workspace.has_process_redirect("get-plan")
         """
+        cache_key = (self._active_team, process_name)
+        cached = self._redirect_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         redirect_path = self._build_process_path(process_name, REDIRECT_FILENAME)
-        return self._filesystem.exists(redirect_path)
+        has_redirect = self._filesystem.exists(redirect_path)
+        self._redirect_cache[cache_key] = has_redirect
+        return has_redirect
+
+    def invalidate_process_caches(self) -> None:
+        """Forget memoized redirect.md and parser.jsonnet existence checks."""
+        self._redirect_cache.clear()
+        self._parser_cache.clear()
 
     def get_process_redirect(self, process_name: str) -> str:
         """Retrieve redirect URI content from redirect.md file.
@@ -1020,6 +1282,70 @@ class PantheonWorkspace:
         path = self._build_process_path(process_name, DIRECTORY_TEMPLATE_FILENAME)
         return self._filesystem.read_text(path)
 
+    def _render_routine_template(
+        self, template_content: str, enhanced_parameters: dict[str, Any]
+    ) -> str:
+        """Render a bundled routine template with the given parameters.
+
+        Templates made only of bare ``{{ name }}`` placeholders are substituted
+        directly; anything else is rendered through the ArtifactEngine.
+
+        Raises:
+            ValueError: If template content is empty
+            RuntimeError: If Jinja rendering fails
+        """
+        rendered_content = _render_simple(template_content, enhanced_parameters)
+        if rendered_content is not None:
+            return rendered_content
+
+        from pantheon.artifact_engine import ArtifactEngine
+
+        # Create a minimal context for template rendering
+        context = enhanced_parameters.copy()
+        # Create temporary ArtifactEngine instance for template rendering
+        temp_engine = ArtifactEngine(workspace=self)
+        return temp_engine.render_template(template_content, context)
+
+    def _default_routine_content(
+        self,
+        routine_filename: str,
+        operation: str,
+        fallback_stub: str,
+        enhanced_parameters: dict[str, Any] | None,
+    ) -> str:
+        """Build routine content from a bundled routine template.
+
+        Args:
+            routine_filename: Template file name under pantheon/_templates/routines
+            operation: Operation label used in log messages (GET, UPDATE, CREATE)
+            fallback_stub: Content used when the template cannot be read
+            enhanced_parameters: Optional parameters for Jinja template rendering
+
+        Returns:
+            Rendered template, the raw template if rendering fails, or the
+            fallback stub if the template cannot be read
+        """
+        try:
+            template_content = self._filesystem.read_bundled_resource(
+                "pantheon", f"_templates/routines/{routine_filename}"
+            )
+        except Exception as e:
+            Log.warning(f"Failed to copy default {operation} routine: {e}")
+            return fallback_stub
+
+        # No parameters provided, use raw template
+        if not enhanced_parameters:
+            return template_content
+
+        try:
+            return self._render_routine_template(template_content, enhanced_parameters)
+        except Exception as render_error:
+            Log.warning(
+                f"Failed to render {operation} routine template: {render_error}"
+            )
+            # Fall back to raw template content
+            return template_content
+
     def copy_default_get_routine(
         self,
         target_path: PantheonPath,
@@ -1037,41 +1363,13 @@ class PantheonWorkspace:
         Returns:
             PantheonPath where the routine was written
         """
-        try:
-            template_content = self._filesystem.read_bundled_resource(
-                "pantheon", f"_templates/routines/{DEFAULT_GET_ROUTINE}"
-            )
-
-            # Render Jinja template if enhanced_parameters provided
-            if enhanced_parameters:
-                try:
-                    from pantheon.artifact_engine import ArtifactEngine
-
-                    # Create a minimal context for template rendering
-                    context = enhanced_parameters.copy()
-                    # Create temporary ArtifactEngine instance for template rendering
-                    temp_engine = ArtifactEngine(workspace=self)
-                    rendered_content = temp_engine.render_template(
-                        template_content, context
-                    )
-                    return self.save_artifact(rendered_content, target_path)
-                except Exception as render_error:
-                    Log.warning(
-                        f"Failed to render GET routine template: {render_error}"
-                    )
-                    # Fall back to raw template content
-                    return self.save_artifact(template_content, target_path)
-            else:
-                # No parameters provided, use raw template
-                return self.save_artifact(template_content, target_path)
-
-        except Exception as e:
-            Log.warning(f"Failed to copy default GET routine: {e}")
-            # Fallback to minimal stub
-            return self.save_artifact(
-                "# Routine: GET Process\n\nReturn sections from an artifact.\n",
-                target_path,
-            )
+        content = self._default_routine_content(
+            DEFAULT_GET_ROUTINE,
+            "GET",
+            "# Routine: GET Process\n\nReturn sections from an artifact.\n",
+            enhanced_parameters,
+        )
+        return self.save_artifact(content, target_path)
 
     def copy_default_update_routine(
         self,
@@ -1087,41 +1385,24 @@ class PantheonWorkspace:
         Returns:
             PantheonPath where the routine was written
         """
-        try:
-            template_content = self._filesystem.read_bundled_resource(
-                "pantheon", f"_templates/routines/{DEFAULT_UPDATE_ROUTINE}"
-            )
-
-            # Render Jinja template if enhanced_parameters provided
-            if enhanced_parameters:
-                try:
-                    from pantheon.artifact_engine import ArtifactEngine
-
-                    # Create a minimal context for template rendering
-                    context = enhanced_parameters.copy()
-                    # Create temporary ArtifactEngine instance for template rendering
-                    temp_engine = ArtifactEngine(workspace=self)
-                    rendered_content = temp_engine.render_template(
-                        template_content, context
-                    )
-                    return self.save_artifact(rendered_content, target_path)
-                except Exception as render_error:
-                    Log.warning(
-                        f"Failed to render UPDATE routine template: {render_error}"
-                    )
-                    # Fall back to raw template content
-                    return self.save_artifact(template_content, target_path)
-            else:
-                # No parameters provided, use raw template
-                return self.save_artifact(template_content, target_path)
+        content = self._default_routine_content(
+            DEFAULT_UPDATE_ROUTINE,
+            "UPDATE",
+            "# Routine: UPDATE Process\n\nReplace content of a target section.\n",
+            enhanced_parameters,
+        )
+        return self.save_artifact(content, target_path)
 
-        except Exception as e:
-            Log.warning(f"Failed to copy default UPDATE routine: {e}")
-            # Fallback to minimal stub
-            return self.save_artifact(
-                "# Routine: UPDATE Process\n\nReplace content of a target section.\n",
-                target_path,
-            )
+    def _default_create_routine_content(
+        self, enhanced_parameters: dict[str, Any] | None
+    ) -> str:
+        """Build CREATE routine content from the bundled template."""
+        return self._default_routine_content(
+            DEFAULT_CREATE_ROUTINE,
+            "CREATE",
+            "# Routine: CREATE Process\n\nRender a new artifact from structured input.\n",
+            enhanced_parameters,
+        )
 
     def copy_default_create_routine(
         self,
@@ -1129,40 +1410,9 @@ class PantheonWorkspace:
         enhanced_parameters: dict[str, Any] | None = None,
     ) -> PantheonPath:
         """Copy bundled CREATE routine boilerplate to target PantheonPath with Jinja rendering."""
-        try:
-            template_content = self._filesystem.read_bundled_resource(
-                "pantheon", f"_templates/routines/{DEFAULT_CREATE_ROUTINE}"
-            )
-
-            # Render Jinja template if enhanced_parameters provided
-            if enhanced_parameters:
-                try:
-                    from pantheon.artifact_engine import ArtifactEngine
-
-                    # Create a minimal context for template rendering
-                    context = enhanced_parameters.copy()
-                    # Create temporary ArtifactEngine instance for template rendering
-                    temp_engine = ArtifactEngine(workspace=self)
-                    rendered_content = temp_engine.render_template(
-                        template_content, context
-                    )
-                    return self.save_artifact(rendered_content, target_path)
-                except Exception as render_error:
-                    Log.warning(
-                        f"Failed to render CREATE routine template: {render_error}"
-                    )
-                    # Fall back to raw template content
-                    return self.save_artifact(template_content, target_path)
-            else:
-                # No parameters provided, use raw template
-                return self.save_artifact(template_content, target_path)
-
-        except Exception as e:
-            Log.warning(f"Failed to copy default CREATE routine: {e}")
-            return self.save_artifact(
-                "# Routine: CREATE Process\n\nRender a new artifact from structured input.\n",
-                target_path,
-            )
+        return self.save_artifact(
+            self._default_create_routine_content(enhanced_parameters), target_path
+        )
 
     # --- High-level scaffolding helpers for BUILD operations ---
     def scaffold_create_process(
@@ -1180,74 +1430,53 @@ class PantheonWorkspace:
         """Create a CREATE process folder with canonical files under bundle_root.
 
         Returns list of PantheonPath objects that were written.
+
+        All files are validated up front and then written in a single
+        FileSystem.write_many batch, creating each parent directory once.
         """
-        written: list[PantheonPath] = []
         proc_root = bundle_root.joinpath(process_name)
 
-        # artifact/content.md
-        try:
-            written.append(
-                self.save_artifact(
-                    content_md, proc_root.joinpath("artifact", "content.md")
-                )
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to scaffold CREATE content.md for {process_name}: {e}"
-            ) from e
-        # artifact/placement.jinja and artifact/naming.jinja
-        try:
-            written.append(
-                self.save_artifact(
-                    placement_jinja,
-                    proc_root.joinpath("artifact", "placement.jinja"),
-                )
+        files: list[tuple[str, PantheonPath]] = [
+            (content_md, proc_root.joinpath("artifact", "content.md")),
+            (placement_jinja, proc_root.joinpath("artifact", "placement.jinja")),
+            (naming_jinja, proc_root.joinpath("artifact", "naming.jinja")),
+            (schema_jsonnet, proc_root.joinpath("schema.jsonnet")),
+        ]
+        if permissions_jsonnet is not None:
+            files.append(
+                (permissions_jsonnet, proc_root.joinpath("permissions.jsonnet"))
             )
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to scaffold CREATE placement.jinja for {process_name}: {e}"
-            ) from e
-        try:
-            written.append(
-                self.save_artifact(
-                    naming_jinja, proc_root.joinpath("artifact", "naming.jinja")
+        if include_default_routine:
+            files.append(
+                (
+                    self._default_create_routine_content(enhanced_parameters),
+                    proc_root.joinpath("routine.md"),
                 )
             )
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to scaffold CREATE naming.jinja for {process_name}: {e}"
-            ) from e
-        # schema.jsonnet
-        try:
-            written.append(
-                self.save_artifact(schema_jsonnet, proc_root.joinpath("schema.jsonnet"))
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to scaffold CREATE schema.jsonnet for {process_name}: {e}"
-            ) from e
-        # permissions.jsonnet (optional)
-        if permissions_jsonnet is not None:
+
+        pending: list[tuple[Path, str]] = []
+        for content, path in files:
             try:
-                written.append(
-                    self.save_artifact(
-                        permissions_jsonnet,
-                        proc_root.joinpath("permissions.jsonnet"),
-                    )
-                )
+                pending.append((self._resolve_artifact_write_path(path), content))
             except Exception as e:
                 raise RuntimeError(
-                    f"Failed to scaffold CREATE permissions.jsonnet for {process_name}: {e}"
+                    f"Failed to scaffold CREATE {path.name} for {process_name}: {e}"
                 ) from e
-        # routine.md
-        if include_default_routine:
-            written.append(
-                self.copy_default_create_routine(
-                    proc_root.joinpath("routine.md"), enhanced_parameters
-                )
-            )
 
-        return written
+        try:
+            # Create each distinct parent directory once, then write in one batch
+            for parent in dict.fromkeys(absolute.parent for absolute, _ in pending):
+                self._filesystem.mkdir(parent, parents=True, exist_ok=True)
+            self._filesystem.write_many(pending)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to scaffold CREATE process files for {process_name}: {e}"
+            ) from e
+
+        return [
+            PantheonPath(str(absolute.relative_to(self._artifacts_root)))
+            for absolute, _ in pending
+        ]
 
     def scaffold_get_process(
         self,
@@ -1472,6 +1701,13 @@ class PantheonWorkspace:
         process's artifact directory, enabling include statements in content.md templates.
         Includes all standard template settings and custom filters used by the framework.
 
+        Settings and filters live on one shared base environment; each process
+        gets a lightweight overlay with its own loader and its own copy of the
+        filters, so filters registered while rendering stay local. Overlays are
+        cached per (active_team, process_name) so repeated renders reuse the same
+        loader and compiled-template cache. Use clear_template_env_cache() to
+        discard cached environments.
+
         Args:
             process_name: Name of the process (e.g., "create-ticket")
 
@@ -1486,28 +1722,44 @@ class PantheonWorkspace:
             template = env.from_string(template_content)
             rendered = template.render(context)
         """
+        cache_key = (self._active_team, process_name)
+        cached_env = self._env_cache.get(cache_key)
+        if cached_env is not None:
+            return cached_env
+
         # Get the absolute path to the process artifact directory
         artifact_dir = self._build_process_path(process_name, ARTIFACT_SUBDIR)
 
-        # Create FileSystemLoader pointing to the artifact directory
-        loader = jinja2.FileSystemLoader(str(artifact_dir))
-
-        # Create environment with same settings as ArtifactEngine
-        env = jinja2.Environment(
-            loader=loader,
-            autoescape=False,  # Disable HTML escaping for text/markdown content
-            undefined=jinja2.DebugUndefined,  # Log undefined variables but allow conditionals
-            trim_blocks=False,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
+        if self._template_base_env is None:
+            # Create environment with same settings as ArtifactEngine
+            base_env = jinja2.Environment(
+                autoescape=False,  # Disable HTML escaping for text/markdown content
+                undefined=jinja2.DebugUndefined,  # Log undefined variables but allow conditionals
+                trim_blocks=False,
+                lstrip_blocks=True,
+                keep_trailing_newline=True,
+            )
 
-        # Register custom filters
-        env.filters["slugify"] = slugify
-        env.filters["remove_suffix"] = remove_suffix
+            # Register custom filters
+            base_env.filters["slugify"] = slugify
+            base_env.filters["remove_suffix"] = remove_suffix
+            self._template_base_env = base_env
+
+        # Overlay with a FileSystemLoader pointing to the artifact directory
+        env = self._template_base_env.overlay(
+            loader=jinja2.FileSystemLoader(str(artifact_dir))
+        )
+        # Overlays share the base filters dict; renderers register per-render
+        # filters (to_yaml), so each cached overlay gets its own copy
+        env.filters = dict(self._template_base_env.filters)
 
+        self._env_cache[cache_key] = env
         return env
 
+    def clear_template_env_cache(self) -> None:
+        """Discard cached artifact template environments."""
+        self._env_cache.clear()
+
     def get_artifact_target_section(self, process_name: str) -> str:
         """Returns preprocessed target section bounds definition for UPDATE operations.
 
@@ -1647,10 +1899,17 @@ class PantheonWorkspace:
             has_parser = workspace.has_artifact_parser("get-ticket")  # True (multi-artifact)
             has_parser = workspace.has_artifact_parser("get-architecture-guide")  # False (singleton)
         """
+        cache_key = (self._active_team, process_name)
+        cached = self._parser_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         parser_path = self._build_process_path(
             process_name, ARTIFACT_SUBDIR, ArtifactRetrieve.PARSER.value
         )
-        return self._filesystem.exists(parser_path)
+        has_parser = self._filesystem.exists(parser_path)
+        self._parser_cache[cache_key] = has_parser
+        return has_parser
 
     def get_artifact_jsonl_filename_template(self, process_name: str) -> str:
         """Returns JSONL filename template for log path generation.
@@ -1849,38 +2108,25 @@ class PantheonWorkspace:
         # Parse semantic URI with sub-path and parameters
         scheme, process_name, sub_path, parameters = self._parse_semantic_uri(uri)
 
-        # Route to appropriate content-retrieval method based on scheme
-        match scheme:
-            case "artifact-content-template":
-                return self.get_artifact_content_template(process_name)
-            case "artifact-directory-template":
-                return self.get_artifact_directory_template(process_name)
-            case "artifact-filename-template":
-                return self.get_artifact_filename_template(process_name)
-            case "artifact-locator":
-                return self.get_artifact_locator(process_name)
-            case "artifact-parser":
-                return self.get_artifact_parser(process_name)
-            case "artifact-section-markers":
-                return self.get_artifact_section_markers(process_name)
-            case "artifact-sections":
-                return self.get_artifact_sections(process_name, parameters.get("data"))
-            case "process-routine":
-                return self.get_process_routine(process_name)
-            case "process-schema":
-                # Route to section schema if sub-path is present
-                if sub_path:
-                    return self.get_section_schema(process_name, sub_path)
-                return self.get_process_schema(process_name)
-            case "artifact-template":
-                # Route to section template if sub-path is present
-                if not sub_path:
-                    raise ValueError(
-                        f"artifact-template:// URIs require sub-path (e.g., sections/section-name): {uri}"
-                    )
-                return self.get_artifact_section_template(process_name, sub_path)
-            case _:
-                raise ValueError(f"Unsupported URI scheme: {scheme}")
+        # Schemes that need the sub-path or query parameters
+        if scheme == "artifact-sections":
+            return self.get_artifact_sections(process_name, parameters.get("data"))
+        if scheme == "artifact-template":
+            if not sub_path:
+                raise ValueError(
+                    f"artifact-template:// URIs require sub-path (e.g., sections/section-name): {uri}"
+                )
+            return self.get_artifact_section_template(process_name, sub_path)
+        if scheme == "process-schema" and sub_path:
+            return self.get_section_schema(process_name, sub_path)
+
+        # Everything else maps straight onto a get_* method
+        try:
+            method_name = self._SCHEME_DISPATCH[scheme]
+        except KeyError:
+            raise ValueError(f"Unsupported URI scheme: {scheme}") from None
+        content: str = getattr(self, method_name)(process_name)
+        return content
 
     def get_matching_artifact(
         self, pattern: str, directory: str | None = None
@@ -1904,7 +2150,7 @@ class PantheonWorkspace:
         be implemented in ArtifactEngine, maintaining architectural boundaries.
         """
         try:
-            compiled_pattern = re.compile(pattern)
+            compiled_pattern = _compile_artifact_pattern(pattern)
         except re.error as e:
             Log.warning(f"Invalid regex pattern '{pattern}': {e}")
             return []
@@ -2260,44 +2506,9 @@ class PantheonWorkspace:
             _parse_semantic_uri("artifact-sections://get-ticket?data=sections.plan")
             # Returns: ("artifact-sections", "get-ticket", None, {"data": "sections.plan"})
         """
-        if "://" not in uri:
-            raise ValueError(f"Invalid semantic URI format (missing ://): {uri}")
-
-        scheme, rest = uri.split("://", 1)
-
-        if not scheme:
-            raise ValueError(f"Invalid semantic URI format (empty scheme): {uri}")
-        if not rest:
-            raise ValueError(
-                f"Invalid semantic URI format (missing process name): {uri}"
-            )
-
-        # Parse query parameters first
-        if "?" in rest:
-            path_part, query_string = rest.split("?", 1)
-
-            # Parse query parameters
-            parameters = {}
-            if query_string:
-                for param_pair in query_string.split("&"):
-                    if "=" in param_pair:
-                        key, value = param_pair.split("=", 1)
-                        parameters[key] = value
-                    else:
-                        # Parameter without value (e.g., ?flag)
-                        parameters[param_pair] = ""
-        else:
-            path_part = rest
-            parameters = {}
-
-        # Parse process name and optional sub-path
-        if "/" in path_part:
-            process_name, sub_path = path_part.split("/", 1)
-        else:
-            process_name = path_part
-            sub_path = None
-
-        return scheme, process_name, sub_path, parameters
+        scheme, process_name, sub_path, parameters = _parse_semantic_uri_impl(uri)
+        # The cached result is shared, so hand out a fresh dict each call
+        return scheme, process_name, sub_path, dict(parameters)
 
     def _preprocess_content(
         self, content: str, base_path: Path, import_stack: set[str] | None = None
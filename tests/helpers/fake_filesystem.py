@@ -0,0 +1,130 @@
+"""Lightweight FileSystem fake that records calls in plain lists."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import call
+
+from pantheon.filesystem import FileSystem
+
+
+class RecordedMethod:
+    """Callable stand-in for a FileSystem method with a Mock-like surface.
+
+    Calls are stored as public ``unittest.mock.call`` objects, so they compare
+    equal to ``call(...)`` and expose ``.args`` / ``.kwargs``. ``call_count`` and
+    ``last_arg`` (first positional argument of the latest call) are plain
+    attributes kept up to date on every call, so assertions read them directly.
+    """
+
+    __slots__ = (
+        "name",
+        "calls",
+        "call_count",
+        "last_arg",
+        "return_value",
+        "side_effect",
+    )
+
+    def __init__(self, name: str, return_value: Any = None) -> None:
+        self.name = name
+        self.calls: list[Any] = []
+        self.call_count = 0
+        self.last_arg: Any = None
+        self.return_value = return_value
+        # An exception (raised) or a callable (called with the arguments)
+        self.side_effect: BaseException | Callable[..., Any] | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(call(*args, **kwargs))
+        self.call_count += 1
+        self.last_arg = args[0] if args else None
+        effect = self.side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException):
+            raise effect
+        return effect(*args, **kwargs)
+
+    @property
+    def called(self) -> bool:
+        return bool(self.calls)
+
+    @property
+    def call_args(self) -> Any:
+        return self.calls[-1] if self.calls else None
+
+    @property
+    def call_args_list(self) -> list[Any]:
+        return list(self.calls)
+
+    def assert_called(self) -> None:
+        assert self.calls, f"Expected '{self.name}' to have been called."
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, (
+            f"Expected '{self.name}' to have been called once. "
+            f"Called {len(self.calls)} times."
+        )
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, (
+            f"Expected '{self.name}' to not have been called. "
+            f"Called {len(self.calls)} times."
+        )
+
+    def reset_mock(
+        self, *, return_value: bool = False, side_effect: bool = False
+    ) -> None:
+        self.calls.clear()
+        self.call_count = 0
+        self.last_arg = None
+        if return_value:
+            self.return_value = None
+        if side_effect:
+            self.side_effect = None
+
+
+class FakeFileSystem(FileSystem):
+    """FileSystem whose public methods are RecordedMethod instances.
+
+    Nothing touches the disk: every method returns its configured
+    ``return_value`` (or the result of ``side_effect``). ``exists`` defaults to
+    False, and ``find_marker`` is answered through ``exists`` so marker
+    lookups show up as recorded probes. Use it instead of
+    ``Mock(spec=FileSystem)`` in tests that call the filesystem many times and
+    only need call recording. Like ``Mock(spec_set=FileSystem)``, assigning an
+    attribute that is not a FileSystem method raises AttributeError, so a
+    misspelled method name fails loudly instead of being silently ignored.
+    """
+
+    def __init__(self) -> None:
+        for name in _FILESYSTEM_METHODS:
+            setattr(self, name, RecordedMethod(name))
+        self.exists.return_value = False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in _FILESYSTEM_METHODS:
+            raise AttributeError(
+                f"FakeFileSystem has no FileSystem method {name!r} to set"
+            )
+        super().__setattr__(name, value)
+
+    def find_marker(self, directory: Path | str, name: str) -> bool:
+        """Route marker lookups through the recorded ``exists`` probe."""
+        return bool(self.exists(os.path.join(directory, name)))
+
+    def reset_mock(self) -> None:
+        """Forget recorded calls on every method, keeping configured results."""
+        for name in _FILESYSTEM_METHODS:
+            getattr(self, name).reset_mock()
+
+
+_FILESYSTEM_METHODS: tuple[str, ...] = tuple(
+    name
+    for name, value in vars(FileSystem).items()
+    if callable(value) and not name.startswith("_") and name != "find_marker"
+)
@@ -0,0 +1,120 @@
+"""In-memory FileSystem backed by plain dicts instead of the disk."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import fnmatch
+from pathlib import Path
+import posixpath
+
+from pantheon.filesystem import FileSystem
+
+
+def _key(path: Path | str) -> str:
+    """Return the forward-slash string form used to key stored entries."""
+    return str(path).replace("\\", "/")
+
+
+class MemFileSystem(FileSystem):
+    """FileSystem that keeps files and directories in memory.
+
+    Entries are keyed by their forward-slash string form. ``last_read`` holds
+    the path of the most recent ``read_text`` call and ``writes`` records every
+    ``write_text``/``append_text`` call as (path, content), in order; clear
+    them directly between steps of a test. When ``default_text`` is set it is
+    returned for reads of files that were never written, for tests that only
+    care which path was read. Parent directories are not required to exist
+    before writing.
+    """
+
+    def __init__(self, files: Mapping[str, str] | None = None) -> None:
+        self.files: dict[str, str] = dict(files or {})
+        self.dirs: set[str] = set()
+        self.writes: list[tuple[str, str]] = []
+        self.last_read: str | None = None
+        self.default_text: str | None = None
+
+    def read_text(self, path: Path | str, encoding: str = "utf-8") -> str:
+        key = _key(path)
+        self.last_read = key
+        try:
+            return self.files[key]
+        except KeyError:
+            if self.default_text is not None:
+                return self.default_text
+            raise FileNotFoundError(key) from None
+
+    def write_text(
+        self, path: Path | str, content: str, encoding: str = "utf-8"
+    ) -> None:
+        key = _key(path)
+        self.files[key] = content
+        self.writes.append((key, content))
+
+    def append_text(
+        self, path: Path | str, content: str, encoding: str = "utf-8"
+    ) -> None:
+        key = _key(path)
+        self.files[key] = self.files.get(key, "") + content
+        self.writes.append((key, content))
+
+    def exists(self, path: Path | str) -> bool:
+        key = _key(path)
+        return key in self.files or key in self.dirs
+
+    def find_marker(self, directory: Path | str, name: str) -> bool:
+        return posixpath.join(_key(directory), name) in self.files
+
+    def mkdir(
+        self, path: Path | str, parents: bool = False, exist_ok: bool = False
+    ) -> None:
+        key = _key(path)
+        if key in self.dirs and not exist_ok:
+            raise FileExistsError(key)
+        self.dirs.add(key)
+        if parents:
+            parent = posixpath.dirname(key)
+            while parent not in self.dirs and parent != posixpath.dirname(parent):
+                self.dirs.add(parent)
+                parent = posixpath.dirname(parent)
+
+    def rmdir(self, path: Path | str) -> None:
+        key = _key(path)
+        if key not in self.dirs:
+            raise FileNotFoundError(key)
+        if self._children(key):
+            raise OSError(f"Directory not empty: {key}")
+        self.dirs.remove(key)
+
+    def unlink(self, path: Path | str, missing_ok: bool = False) -> None:
+        key = _key(path)
+        if self.files.pop(key, None) is None and not missing_ok:
+            raise FileNotFoundError(key)
+
+    def iterdir(self, path: Path | str) -> Iterator[Path]:
+        key = _key(path)
+        children = self._children(key)
+        if not children and key not in self.dirs:
+            raise FileNotFoundError(key)
+        return iter([Path(child) for child in sorted(children)])
+
+    def glob(self, directory: Path | str, pattern: str) -> list[Path]:
+        prefix = _key(directory).rstrip("/") + "/"
+        return [
+            Path(name)
+            for name in sorted(self.files)
+            if name.startswith(prefix) and fnmatch.fnmatch(name[len(prefix) :], pattern)
+        ]
+
+    def _children(self, directory: str) -> set[str]:
+        """Return the entries directly under ``directory``, implied ones included.
+
+        A stored file such as ``a/b/c.md`` makes ``a/b`` a child of ``a`` even
+        if ``a/b`` was never created with mkdir.
+        """
+        prefix = directory.rstrip("/") + "/"
+        return {
+            prefix + name[len(prefix) :].split("/", 1)[0]
+            for name in (*self.files, *self.dirs)
+            if name.startswith(prefix) and len(name) > len(prefix)
+        }
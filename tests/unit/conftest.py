@@ -0,0 +1,112 @@
+"""Shared fixtures for the unit test suite.
+
+Fixtures used by more than one module live here instead of being redefined
+per file: frozen session data, plus a team-configured workspace built once per
+module and copied onto a fresh FakeFileSystem for each test. Class-level
+fixtures of the same name in individual modules take precedence over these.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import copy
+from types import MappingProxyType
+from typing import Final
+
+import pytest
+
+from pantheon.workspace import PantheonWorkspace, ProjectConfig
+from tests.helpers.fake_filesystem import FakeFileSystem
+
+# Frozen fixture data, importable outside pytest for profiling scripts
+_SAMPLE_PATHS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "project_root_str": "/test/project",
+        "artifacts_root_str": "/test/project/pantheon-artifacts",
+    }
+)
+
+_MOCK_CONTENT_RESPONSES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "process-schema": '{\n  "type": "object",\n  "properties": {\n    "title": {"type": "string"}\n  }\n}',
+        "process-routine": "# Process Steps\n\n1. Initialize\n2. Execute\n3. Complete",
+        "artifact-locator": '{\n  "pattern": "^({id})_.*\\.md$"\n}',
+        "artifact-parser": '[\n  {"pattern": "^\\s+", "replacement": ""}\n]',
+        "artifact-section-markers": '{\n  "start": "<!-- START -->",\n  "end": "<!-- END -->"\n}',
+        "artifact-content-template": "# {{title}}\n\n{{content}}",
+        "artifact-directory-template": "{{team}}/{{process}}",
+        "artifact-filename-template": "{{id}}_{{date}}.md",
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def sample_paths() -> Mapping[str, str]:
+    """Create sample path instances for testing.
+
+    Shared across the session (and safe under pytest-xdist), so it is frozen.
+
+    Returns:
+        Read-only mapping of named path instances for test scenarios
+    """
+    return _SAMPLE_PATHS
+
+
+@pytest.fixture(scope="session")
+def mock_content_responses() -> Mapping[str, str]:
+    """Create mock content responses for different URI types.
+
+    Returns:
+        Read-only mapping of URI schemes to mock content
+    """
+    return _MOCK_CONTENT_RESPONSES
+
+
+@pytest.fixture(scope="module")
+def module_workspace(sample_paths: Mapping[str, str]) -> PantheonWorkspace:
+    """Create a PantheonWorkspace with test team configuration once per module.
+
+    Args:
+        sample_paths: Sample path instances
+
+    Returns:
+        PantheonWorkspace configured with an active team; tests use copies
+    """
+    # A fresh fake reports no .pantheon_project, so defaults are loaded
+    workspace = PantheonWorkspace(
+        project_root=sample_paths["project_root_str"],
+        artifacts_root=sample_paths["artifacts_root_str"],
+        filesystem=FakeFileSystem(),
+    )
+    workspace._project_config = ProjectConfig(
+        active_team="test-team", artifacts_root="pantheon-artifacts"
+    )
+    return workspace
+
+
+@pytest.fixture
+def fake_filesystem() -> FakeFileSystem:
+    """Create a call-recording fake FileSystem for a single test.
+
+    Returns:
+        FakeFileSystem exposing the Mock surface the tests use
+    """
+    return FakeFileSystem()
+
+
+@pytest.fixture
+def team_workspace(
+    module_workspace: PantheonWorkspace, fake_filesystem: FakeFileSystem
+) -> PantheonWorkspace:
+    """Copy the module-scoped workspace and bind it to this test's filesystem.
+
+    Args:
+        module_workspace: Workspace configured once for the whole module
+        fake_filesystem: Fake FileSystem dependency for this test
+
+    Returns:
+        Configured PantheonWorkspace for testing with active team
+    """
+    workspace = copy.copy(module_workspace)
+    workspace._filesystem = fake_filesystem
+    return workspace
@@ -9,8 +9,11 @@ contains only interface definitions. They serve as behavioral contracts for
 Phase 2 TDD implementation.
 """
 
+import os
 from pathlib import Path
 
+import pytest
+
 from pantheon.filesystem import FileSystem
 
 
@@ -124,6 +127,54 @@ class TestFileSystem:
         # Assert
         assert test_file.read_text(encoding="utf-8") == test_content
 
+    def test_write_many_writes_each_entry(self, tmp_path):
+        """Test that write_many writes every (path, content) pair."""
+        # Arrange
+        filesystem = FileSystem()
+        first_file = tmp_path / "first.txt"
+        second_file = tmp_path / "second.txt"
+
+        # Act
+        filesystem.write_many([(first_file, "one"), (str(second_file), "two")])
+
+        # Assert
+        assert first_file.read_text() == "one"
+        assert second_file.read_text() == "two"
+
+    def test_find_marker_matches_entry_names(self, tmp_path):
+        """Test that find_marker reports only entries directly in the directory."""
+        # Arrange
+        filesystem = FileSystem()
+        (tmp_path / ".pantheon_project").write_text("")
+        (tmp_path / "nested").mkdir()
+
+        # Act & Assert
+        assert filesystem.find_marker(tmp_path, ".pantheon_project") is True
+        assert filesystem.find_marker(str(tmp_path), ".pantheon_project") is True
+        assert filesystem.find_marker(tmp_path / "nested", ".pantheon_project") is False
+        assert (
+            filesystem.find_marker(tmp_path / "missing", ".pantheon_project") is False
+        )
+
+    @pytest.mark.skipif(
+        os.name == "nt" or os.geteuid() == 0,
+        reason="needs POSIX permissions that apply to the current user",
+    )
+    def test_find_marker_in_searchable_but_unlistable_directory(self, tmp_path):
+        """Test that find_marker agrees with exists() for execute-only directories."""
+        # Arrange
+        filesystem = FileSystem()
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / ".pantheon_project").write_text("")
+        locked.chmod(0o111)
+
+        # Act & Assert
+        try:
+            assert filesystem.find_marker(locked, ".pantheon_project") is True
+        finally:
+            locked.chmod(0o755)
+
     def test_exists_returns_true_for_existing_file(self, tmp_path):
         """Test that exists returns True for existing file."""
         # Arrange
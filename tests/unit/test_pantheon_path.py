@@ -7,6 +7,8 @@ operations to enforce architectural boundaries.
 
 from pathlib import Path
 
+import pytest
+
 # This import will fail initially - that's expected for TDD
 from pantheon.path import PantheonPath
 
@@ -22,8 +24,6 @@ class TestPantheonPathCreation:
 
     def test_pantheon_path_rejects_path_object_input(self) -> None:
         """PantheonPath should reject pathlib.Path objects per T015."""
-        import pytest
-
         pathlib_path = Path("test/path")
         with pytest.raises(ValueError, match="All path segments must be strings"):
             PantheonPath(pathlib_path)
@@ -40,10 +40,6 @@ class TestPantheonPathT015Constraints:
 
     def test_rejects_absolute_unix_paths(self) -> None:
         """PantheonPath should reject absolute Unix-style paths per T015."""
-        from pathlib import Path
-
-        import pytest
-
         # Only test if we're on a Unix-like system where / is absolute
         if Path("/").is_absolute():
             with pytest.raises(ValueError, match="must represent a relative path"):
@@ -54,39 +50,34 @@ class TestPantheonPathT015Constraints:
                 PantheonPath("//server/share/path")
 
     def test_rejects_absolute_windows_paths(self) -> None:
-        """PantheonPath should reject absolute Windows paths per T015."""
-        import platform
-
-        import pytest
-
-        # On Windows, this will be rejected; on Unix, it's a relative path
-        if platform.system() == "Windows":
+        """PantheonPath should reject absolute Windows paths on every platform."""
+        for absolute in ("C:\\Windows\\System32", "d:/data", "\\\\server\\share"):
             with pytest.raises(ValueError, match="must represent a relative path"):
-                PantheonPath("C:\\Windows\\System32")
-        else:
-            # On Unix systems, Windows paths are treated as relative paths
-            # So we test Unix absolute paths instead
+                PantheonPath(absolute)
+
+    def test_rejects_home_directory_paths(self) -> None:
+        """PantheonPath should reject paths rooted at the home directory."""
+        for home in ("~", "~/notes.md"):
             with pytest.raises(ValueError, match="must represent a relative path"):
-                PantheonPath("/usr/bin")
+                PantheonPath(home)
+
+    def test_accepts_tilde_inside_a_name(self) -> None:
+        """A tilde that does not stand for the home directory is allowed."""
+        assert str(PantheonPath("~draft.md")) == "~draft.md"
+        assert str(PantheonPath("docs", "~backup")) == "docs/~backup"
 
     def test_rejects_empty_arguments(self) -> None:
         """PantheonPath should require at least one path segment per T015."""
-        import pytest
-
         with pytest.raises(ValueError, match="requires at least one path segment"):
             PantheonPath()
 
     def test_rejects_mixed_type_arguments(self) -> None:
         """PantheonPath should reject mixed string/non-string arguments per T015."""
-        import pytest
-
         with pytest.raises(ValueError, match="All path segments must be strings"):
             PantheonPath("test", 123, "file.txt")
 
     def test_rejects_integer_arguments(self) -> None:
         """PantheonPath should reject integer arguments per T015."""
-        import pytest
-
         with pytest.raises(ValueError, match="All path segments must be strings"):
             PantheonPath(123)
 
@@ -270,6 +261,22 @@ class TestPantheonPathValueObjectSemantics:
         assert "test" in str_repr
         assert "file.txt" in str_repr
 
+    def test_string_and_parts_are_computed_once(self) -> None:
+        """str() and parts should return the same cached objects on every call."""
+        path = PantheonPath("test", "sub", "file.txt")
+
+        assert str(path) == "test/sub/file.txt"
+        assert str(path) is str(path)
+        assert path.parts == ("test", "sub", "file.txt")
+        assert path.parts is path.parts
+
+    def test_instances_have_no_attribute_dict(self) -> None:
+        """PantheonPath uses __slots__, so arbitrary attributes cannot be added."""
+        path = PantheonPath("test", "file.txt")
+
+        with pytest.raises(AttributeError):
+            path.extra = "value"  # type: ignore[attr-defined]
+
     def test_repr_representation_works(self) -> None:
         """PantheonPath should have repr representation."""
         path = PantheonPath("test", "file.txt")
@@ -36,6 +36,19 @@ class TestValidatePathSafety:
         with pytest.raises(PathSecurityError, match="Directory traversal"):
             validate_path_safety("foo/bar/../../../etc/passwd")
 
+    def test_rejects_backslash_traversal_on_any_platform(self):
+        """Backslash-separated .. components should be rejected on every OS."""
+        with pytest.raises(PathSecurityError, match="Directory traversal"):
+            validate_path_safety("..\\etc\\passwd")
+
+        with pytest.raises(PathSecurityError, match="Directory traversal"):
+            validate_path_safety("foo\\..")
+
+    def test_allows_double_dots_inside_component(self):
+        """Dots that are part of a longer component are not traversal."""
+        validate_path_safety("file...txt")
+        validate_path_safety("foo/..bar/baz..")
+
     def test_rejects_url_encoded_traversal(self):
         """URL-encoded .. sequences should be rejected."""
         with pytest.raises(PathSecurityError, match="Directory traversal"):
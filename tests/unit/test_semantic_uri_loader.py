@@ -124,33 +124,32 @@ class TestSemanticUriLoader:
 
         mock_workspace.get_resolved_content.assert_called_once_with(uri)
 
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "artifact-template://update-guide/sections/overview",
+            "process-schema://create-ticket",
+            "process-routine://update-plan",
+        ],
+    )
     def test_loader_handles_multiple_semantic_uri_schemes(
-        self, semantic_uri_loader: SemanticUriLoader, mock_workspace: Mock
+        self, semantic_uri_loader: SemanticUriLoader, mock_workspace: Mock, uri: str
     ) -> None:
         """Test loader handles various semantic URI schemes correctly.
 
         Validates that SemanticUriLoader properly detects and delegates
         multiple types of semantic URIs beyond just artifact-template://.
         """
-        # Test various semantic URI schemes
-        test_uris = [
-            "artifact-template://update-guide/sections/overview",
-            "process-schema://create-ticket",
-            "process-routine://update-plan",
-        ]
-
-        for uri in test_uris:
-            # Arrange: Reset mock and configure response
-            mock_workspace.reset_mock()
-            mock_workspace.get_resolved_content.return_value = f"Content for {uri}"
+        # Arrange: Configure response
+        mock_workspace.get_resolved_content.return_value = f"Content for {uri}"
 
-            # Act: Request template
-            source, filename, uptodate = semantic_uri_loader.get_source(None, uri)
+        # Act: Request template
+        source, filename, uptodate = semantic_uri_loader.get_source(None, uri)
 
-            # Assert: Verify each URI type is delegated
-            assert source == f"Content for {uri}"
-            assert filename == uri
-            mock_workspace.get_resolved_content.assert_called_once_with(uri)
+        # Assert: Verify each URI type is delegated
+        assert source == f"Content for {uri}"
+        assert filename == uri
+        mock_workspace.get_resolved_content.assert_called_once_with(uri)
 
 
 class TestJinja2EnvironmentIntegration:
@@ -7,21 +7,43 @@ artifact management, convention-based path resolution, and security validation.
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
 from pantheon.filesystem import FileSystem
 from pantheon.path import PantheonPath
-from pantheon.workspace import PantheonWorkspace, ProjectConfig, SecurityError
+from pantheon.workspace import (
+    PantheonWorkspace,
+    ProjectConfig,
+    SecurityError,
+    _render_simple,
+    clear_discovery_cache,
+    invalidate_project_config,
+)
+from tests.helpers.fake_filesystem import FakeFileSystem
 
 # Function removed - using proper pathlib operations instead
 
+# PantheonPath is an immutable value object, so shared inputs are built once
+_P_TEST_ARTIFACT = PantheonPath("test/artifact.txt")
+_P_SAFE = PantheonPath("safe/relative/path.txt")
+_P_SAFE_SEGMENTS = PantheonPath("safe", "relative", "path.txt")
+_P_TRAVERSAL = PantheonPath("../../../etc/passwd")
+
 
 class TestPantheonWorkspace:
     """Test suite for PantheonWorkspace facade interface."""
 
+    @pytest.fixture(autouse=True)
+    def cold_workspace_caches(self) -> None:
+        """Start every test with no memoized discovery or configuration results."""
+        clear_discovery_cache()
+        invalidate_project_config()
+
     @pytest.fixture
     def mock_filesystem(self) -> Mock:
         """Create a mock FileSystem for dependency injection.
@@ -71,6 +93,11 @@ class TestPantheonWorkspace:
             filesystem=mock_filesystem,
         )
 
+    @pytest.fixture
+    def fake_filesystem(self) -> FakeFileSystem:
+        """Call-recording FileSystem fake for discovery tests that probe often."""
+        return FakeFileSystem()
+
     def test_workspace_init(
         self, mock_filesystem: Mock, sample_paths: dict[str, str]
     ) -> None:
@@ -93,12 +120,10 @@ class TestPantheonWorkspace:
         assert hasattr(workspace, "_filesystem")
         assert workspace._filesystem is mock_filesystem
 
-    def test_discover_project_root_found(
-        self, mock_filesystem: Mock, sample_paths: dict[str, str]
-    ) -> None:
+    def test_discover_project_root_found(self, fake_filesystem: FakeFileSystem) -> None:
         """Test project root discovery when marker file exists.
 
-        Mocks FileSystem.exists() to simulate finding .pantheon_project marker
+        Fakes FileSystem.exists() to simulate finding .pantheon_project marker
         and verifies correct project root identification.
         """
 
@@ -106,34 +131,34 @@ class TestPantheonWorkspace:
         def mock_exists(path: Path) -> bool:
             return str(path).endswith(".pantheon_project") and "project" in str(path)
 
-        mock_filesystem.exists.side_effect = mock_exists
+        fake_filesystem.exists.side_effect = mock_exists
 
         result = PantheonWorkspace.discover_project_root(
-            mock_filesystem, "/test/project/src"
+            fake_filesystem, "/test/project/src"
         )
 
         assert result is not None
         assert "project" in result
         # Verify exists was called with marker path
-        mock_filesystem.exists.assert_called()
+        fake_filesystem.exists.assert_called()
 
     def test_discover_project_root_not_found(
-        self, mock_filesystem: Mock, sample_paths: dict[str, str]
+        self, fake_filesystem: FakeFileSystem
     ) -> None:
         """Test project root discovery when marker file doesn't exist.
 
-        Mocks FileSystem.exists() to return False and verifies None is returned
+        Fakes FileSystem.exists() to return False and verifies None is returned
         when no marker file is found in the directory tree.
         """
         # Mock no marker file found
-        mock_filesystem.exists.return_value = False
+        fake_filesystem.exists.return_value = False
 
         result = PantheonWorkspace.discover_project_root(
-            mock_filesystem, "/test/project/src"
+            fake_filesystem, "/test/project/src"
         )
 
         assert result is None
-        mock_filesystem.exists.assert_called()
+        fake_filesystem.exists.assert_called()
 
     def test_save_artifact(
         self, workspace: PantheonWorkspace, mock_filesystem: Mock
@@ -144,7 +169,7 @@ class TestPantheonWorkspace:
         mkdir(), verifying sandboxing enforcement and proper I/O operations.
         """
         content = "Test artifact content"
-        path = PantheonPath("test/artifact.txt")
+        path = _P_TEST_ARTIFACT
 
         # Mock parent directory doesn't exist initially
         mock_filesystem.exists.return_value = False
@@ -158,35 +183,108 @@ class TestPantheonWorkspace:
         # Verify returned path includes output root
         assert "test" in str(result) and "artifact.txt" in str(result)
 
-    def test_get_process_schema(
-        self, workspace: PantheonWorkspace, mock_filesystem: Mock
-    ) -> None:
-        """Test process schema retrieval using content-retrieval method.
+    @pytest.fixture
+    def workspace_with_team(self, workspace: PantheonWorkspace) -> PantheonWorkspace:
+        """Create a workspace with an active team for content-retrieval tests.
 
-        Validates that get_process_schema correctly constructs the path
-        and retrieves schema content from the active team's process directory.
-        """
-        expected_content = '{ "type": "object" }'
-        process_name = "create-ticket"
+        Args:
+            workspace: Base workspace with mocked dependencies
 
-        # Set up active team
+        Returns:
+            PantheonWorkspace configured with test-team as the active team
+        """
         workspace._project_config = {
             "active_team": "test-team",
             "artifacts_root": "artifacts",
         }
-        mock_filesystem.read_text.return_value = expected_content
+        return workspace
+
+    @pytest.mark.parametrize(
+        "method,args,file_content,expected,expected_parts,expected_file",
+        [
+            (
+                "get_process_schema",
+                ("create-ticket",),
+                '{ "type": "object" }',
+                '{ "type": "object" }',
+                {"pantheon-teams", "test-team", "processes", "create-ticket"},
+                "schema.jsonnet",
+            ),
+            (
+                "get_process_routine",
+                ("update-plan",),
+                "# Process Routine\\n\\n1. Step one\\n2. Step two",
+                "# Process Routine\\n\\n1. Step one\\n2. Step two",
+                {"pantheon-teams", "test-team", "processes", "update-plan"},
+                "routine.md",
+            ),
+            (
+                "get_artifact_parser",
+                ("get-ticket",),
+                '[{"pattern": "^\\\\s+|\\\\s+$", "replacement": ""}]',
+                '[{"pattern": "^\\\\s+|\\\\s+$", "replacement": ""}]',
+                {"pantheon-teams", "test-team", "get-ticket", "artifact"},
+                "parser.jsonnet",
+            ),
+            (
+                "get_permissions",
+                ("create-ticket",),
+                '{"allow": ["tech-lead"], "deny": []}',
+                '{"allow": ["tech-lead"], "deny": []}',
+                {"pantheon-teams", "test-team", "processes", "create-ticket"},
+                "permissions.jsonnet",
+            ),
+            (
+                "get_config",
+                ("settings",),
+                "key: value\nnested:\n  item: test",
+                {"key": "value", "nested": {"item": "test"}},
+                {"pantheon-teams", "test-team", "config"},
+                "settings.yaml",
+            ),
+            (
+                "get_section_schema",
+                ("update-guide", "sections/core-principles"),
+                '{"type": "object", "properties": {"name": {"type": "string"}}}',
+                '{"type": "object", "properties": {"name": {"type": "string"}}}',
+                {"pantheon-teams", "update-guide", "artifact", "sections"},
+                "core-principles.schema.jsonnet",
+            ),
+        ],
+        ids=[
+            "process_schema",
+            "process_routine",
+            "artifact_parser",
+            "permissions",
+            "config",
+            "section_schema",
+        ],
+    )
+    def test_content_retrieval(
+        self,
+        workspace_with_team: PantheonWorkspace,
+        mock_filesystem: Mock,
+        method: str,
+        args: tuple[str, ...],
+        file_content: str,
+        expected: Any,
+        expected_parts: set[str],
+        expected_file: str,
+    ) -> None:
+        """Test content-retrieval methods read from the active team's directory.
 
-        result = workspace.get_process_schema(process_name)
+        Validates that each content-retrieval method constructs the conventional
+        path under the active team and returns the (parsed) file content.
+        """
+        mock_filesystem.read_text.return_value = file_content
 
-        assert result == expected_content
+        result = getattr(workspace_with_team, method)(*args)
+
+        assert result == expected
         mock_filesystem.read_text.assert_called_once()
-        # Verify the path construction includes team and process structure
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        assert "pantheon-teams" in str(call_args)
-        assert "test-team" in str(call_args)
-        assert "processes" in str(call_args)
-        assert "create-ticket" in str(call_args)
-        assert "schema.jsonnet" in str(call_args)
+        parts = Path(str(mock_filesystem.read_text.call_args[0][0])).parts
+        assert expected_parts.issubset(parts)
+        assert parts[-1] == expected_file
 
     def test_get_resolved_content_semantic_uri(
         self, workspace: PantheonWorkspace, mock_filesystem: Mock
@@ -282,38 +380,6 @@ class TestPantheonWorkspace:
         assert sub_path == "custom-section"
         assert parameters == {"data": "sections.plan"}
 
-    def test_get_section_schema(
-        self, workspace: PantheonWorkspace, mock_filesystem: Mock
-    ) -> None:
-        """Test get_section_schema retrieves section schemas correctly.
-
-        Validates that section schemas are loaded from the conventional path
-        and preprocessed to resolve imports.
-        """
-        # Arrange
-        workspace._project_config = {
-            "active_team": "test-team",
-            "artifacts_root": "artifacts",
-        }
-        expected_content = (
-            '{"type": "object", "properties": {"name": {"type": "string"}}}'
-        )
-        mock_filesystem.read_text.return_value = expected_content
-
-        # Act
-        result = workspace.get_section_schema(
-            "update-guide", "sections/core-principles"
-        )
-
-        # Assert
-        assert result == expected_content
-        mock_filesystem.read_text.assert_called_once()
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        assert "update-guide" in str(call_args)
-        assert "artifact" in str(call_args)
-        assert "sections" in str(call_args)
-        assert "core-principles.schema.jsonnet" in str(call_args)
-
     def test_get_section_schema_prevents_directory_traversal(
         self, workspace: PantheonWorkspace
     ) -> None:
@@ -403,19 +469,19 @@ class TestPantheonWorkspace:
         """
         result = workspace.create_tempfile(suffix=".json", prefix="test_")
 
-        assert "temp" in str(result)
+        s = str(result)
+        assert "temp" in s and "test_" in s
         assert result.suffix == ".json"
-        assert "test_" in str(result)
 
     def test_create_tempfile_no_options(self, workspace: PantheonWorkspace) -> None:
         """Test temporary file creation without prefix or suffix options."""
         result = workspace.create_tempfile()
 
-        assert "temp" in str(result)
-        # Should contain UUID-like string (check filename part only)
-        import os
-
-        filename = os.path.basename(str(result))
+        s = str(result)
+        assert "temp" in s
+        # Should contain UUID-like string (check filename part only);
+        # PantheonPath.__str__ always normalizes separators to "/"
+        filename = s.rsplit("/", 1)[-1]
         assert len(filename) == 53  # YYYY-MM-DD_HH-MM + _ + UUID length
 
     def test_get_team_package_path(self, workspace: PantheonWorkspace) -> None:
@@ -428,82 +494,10 @@ class TestPantheonWorkspace:
 
         result = workspace.get_team_package_path(team)
 
-        from pathlib import Path
-
         actual_path = Path(str(result))
         assert "pantheon-teams" in actual_path.parts
         assert "backend-team" in actual_path.parts
 
-    def test_get_artifact_normalizer(
-        self, workspace: PantheonWorkspace, mock_filesystem: Mock
-    ) -> None:
-        """Test artifact normalizer rules retrieval.
-
-        Validates that get_artifact_normalizer correctly constructs the path
-        and retrieves normalizer rules from the process artifact directory.
-        Uses new RETRIEVE operation naming convention (parser.jsonnet).
-        """
-        expected_content = '[{"pattern": "^\\\\s+|\\\\s+$", "replacement": ""}]'
-        process_name = "get-ticket"
-
-        workspace._project_config = {
-            "active_team": "test-team",
-            "artifacts_root": "artifacts",
-        }
-        mock_filesystem.read_text.return_value = expected_content
-
-        result = workspace.get_artifact_parser(process_name)
-
-        assert result == expected_content
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        assert "artifact" in str(call_args) and "parser.jsonnet" in str(call_args)
-
-    def test_get_process_routine(
-        self, workspace: PantheonWorkspace, mock_filesystem: Mock
-    ) -> None:
-        """Test process routine retrieval.
-
-        Validates that get_process_routine correctly constructs the path
-        and retrieves routine markdown from the process directory.
-        """
-        expected_content = "# Process Routine\\n\\n1. Step one\\n2. Step two"
-        process_name = "update-plan"
-
-        workspace._project_config = {
-            "active_team": "test-team",
-            "artifacts_root": "artifacts",
-        }
-        mock_filesystem.read_text.return_value = expected_content
-
-        result = workspace.get_process_routine(process_name)
-
-        assert result == expected_content
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        assert "routine.md" in str(call_args)
-
-    def test_get_config(
-        self, workspace: PantheonWorkspace, mock_filesystem: Mock
-    ) -> None:
-        """Test configuration retrieval with YAML parsing.
-
-        Validates that get_config correctly reads and parses YAML configuration
-        files and returns them as dictionaries.
-        """
-        expected_config = {"key": "value", "nested": {"item": "test"}}
-        config_yaml = "key: value\nnested:\n  item: test"
-
-        workspace._project_config = {
-            "active_team": "test-team",
-            "artifacts_root": "artifacts",
-        }
-        mock_filesystem.read_text.return_value = config_yaml
-
-        result = workspace.get_config("settings")
-
-        assert result == expected_config
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        assert "settings.yaml" in str(call_args)
-
     def test_validate_path_security_traversal_attack(
         self, workspace: PantheonWorkspace
     ) -> None:
@@ -512,7 +506,7 @@ class TestPantheonWorkspace:
         Validates that paths containing .. sequences are rejected
         with SecurityError and clear error message.
         """
-        malicious_path = PantheonPath("../../../etc/passwd")
+        malicious_path = _P_TRAVERSAL
 
         with pytest.raises(SecurityError, match="Directory traversal not allowed"):
             workspace._validate_path_security(malicious_path)
@@ -540,7 +534,7 @@ class TestPantheonWorkspace:
             PantheonPath(absolute_path)
 
         # Verify that relative paths still work fine
-        safe_path = PantheonPath("safe", "relative", "path.txt")
+        safe_path = _P_SAFE_SEGMENTS
         # This should not raise an exception
         workspace._validate_path_security(safe_path)
 
@@ -552,7 +546,7 @@ class TestPantheonWorkspace:
         Validates that normal relative paths without traversal
         sequences are accepted without errors.
         """
-        safe_path = PantheonPath("safe/relative/path.txt")
+        safe_path = _P_SAFE
 
         # Should not raise any exception
         workspace._validate_path_security(safe_path)
@@ -621,29 +615,6 @@ artifacts_root: artifacts"""
         assert workspace._project_config["active_team"] == "backend-team"
         assert workspace._project_config["artifacts_root"] == "artifacts"
 
-    def test_get_permissions(
-        self, workspace: PantheonWorkspace, mock_filesystem: Mock
-    ) -> None:
-        """Test permissions configuration retrieval.
-
-        Validates that get_permissions correctly reads permissions.jsonnet
-        from the active team directory.
-        """
-        expected_content = '{"allow": ["tech-lead"], "deny": []}'
-        process_name = "create-ticket"
-
-        workspace._project_config = {
-            "active_team": "test-team",
-            "artifacts_root": "artifacts",
-        }
-        mock_filesystem.read_text.return_value = expected_content
-
-        result = workspace.get_permissions(process_name)
-
-        assert result == expected_content
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        assert "permissions.jsonnet" in str(call_args)
-
     def test_get_team_package_path_with_active_team(
         self, workspace: PantheonWorkspace
     ) -> None:
@@ -658,8 +629,6 @@ artifacts_root: artifacts"""
 
         result = workspace.get_team_package_path()
 
-        from pathlib import Path
-
         actual_path = Path(str(result))
         assert "pantheon-teams" in actual_path.parts
         assert "active-team" in actual_path.parts
@@ -675,8 +644,6 @@ artifacts_root: artifacts"""
 
         result = workspace._get_active_team_root()
 
-        from pathlib import Path
-
         actual_path = Path(str(result))
         assert "pantheon-teams" in actual_path.parts
         assert "backend" in actual_path.parts
@@ -693,6 +660,53 @@ artifacts_root: artifacts"""
         with pytest.raises(ValueError, match="No active_team configured"):
             workspace._get_active_team_root()
 
+    def test_assigning_project_config_recomputes_team_roots(
+        self, workspace: PantheonWorkspace
+    ) -> None:
+        """Test team roots are derived once per config assignment.
+
+        Validates the cached roots follow the active team and back process paths.
+        """
+        workspace._project_config = ProjectConfig(
+            active_team="backend", artifacts_root="pantheon-artifacts"
+        )
+        backend_root = workspace._get_active_team_root()
+        assert workspace._get_active_team_root() is backend_root
+        assert workspace._build_process_path("create-ticket", "schema.jsonnet") == (
+            backend_root / "processes" / "create-ticket" / "schema.jsonnet"
+        )
+
+        workspace._project_config = ProjectConfig(
+            active_team="frontend", artifacts_root="pantheon-artifacts"
+        )
+        assert workspace._get_active_team_root().name == "frontend"
+
+        workspace._project_config = ProjectConfig(
+            active_team="", artifacts_root="pantheon-artifacts"
+        )
+        with pytest.raises(ValueError, match="No active_team configured"):
+            workspace._build_process_path("create-ticket", "schema.jsonnet")
+
+    def test_project_config_cannot_be_changed_in_place(
+        self, workspace: PantheonWorkspace
+    ) -> None:
+        """Test the config view is read-only so team roots and cache keys agree.
+
+        Switching teams requires assigning a new configuration, which moves the
+        roots and the per-process cache keys together.
+        """
+        workspace._project_config = ProjectConfig(
+            active_team="backend", artifacts_root="pantheon-artifacts"
+        )
+        with pytest.raises(TypeError):
+            workspace._project_config["active_team"] = "frontend"  # type: ignore[index]
+
+        workspace._project_config = ProjectConfig(
+            active_team="frontend", artifacts_root="pantheon-artifacts"
+        )
+        assert workspace._active_team == "frontend"
+        assert workspace._get_active_team_root().name == "frontend"
+
     # Phase 1 Comprehensive Tests - Constructor Tests
 
     def test_workspace_init_with_valid_config(
@@ -787,28 +801,29 @@ artifacts_root: custom-artifacts
     # Phase 1 Comprehensive Tests - Project Discovery Tests
 
     def test_discover_project_root_from_project_root(
-        self, mock_filesystem: Mock
+        self, fake_filesystem: FakeFileSystem
     ) -> None:
         """Test project discovery starting from project root directory itself.
 
         Tests discovery when starting path is already the project root containing marker.
         """
         project_root = "/test/project"
+        # Handle path normalization - on Windows, Path().resolve() converts paths
+        resolved_root = str(Path(project_root).resolve())
+        expected_marker = str(Path(resolved_root) / ".pantheon_project")
 
         def mock_exists(path: Path) -> bool:
-            # Handle path normalization - on Windows, Path().resolve() converts paths
-            expected_marker = str(Path(project_root).resolve() / ".pantheon_project")
             return str(path) == expected_marker
 
-        mock_filesystem.exists.side_effect = mock_exists
+        fake_filesystem.exists.side_effect = mock_exists
 
-        result = PantheonWorkspace.discover_project_root(mock_filesystem, project_root)
+        result = PantheonWorkspace.discover_project_root(fake_filesystem, project_root)
 
-        assert result == str(Path(project_root).resolve())
-        mock_filesystem.exists.assert_called()
+        assert result == resolved_root
+        fake_filesystem.exists.assert_called()
 
     def test_discover_project_root_from_deep_nested_path(
-        self, mock_filesystem: Mock
+        self, fake_filesystem: FakeFileSystem
     ) -> None:
         """Test project discovery from 5+ levels deep subdirectory.
 
@@ -816,22 +831,23 @@ artifacts_root: custom-artifacts
         """
         nested_path = "/test/project/src/components/ui/forms/input"
         project_root = "/test/project"
+        # Handle path normalization - on Windows, Path().resolve() converts paths
+        resolved_root = str(Path(project_root).resolve())
+        expected_marker = str(Path(resolved_root) / ".pantheon_project")
 
         def mock_exists(path: Path) -> bool:
-            # Handle path normalization - on Windows, Path().resolve() converts paths
-            expected_marker = str(Path(project_root).resolve() / ".pantheon_project")
             return str(path) == expected_marker
 
-        mock_filesystem.exists.side_effect = mock_exists
+        fake_filesystem.exists.side_effect = mock_exists
 
-        result = PantheonWorkspace.discover_project_root(mock_filesystem, nested_path)
+        result = PantheonWorkspace.discover_project_root(fake_filesystem, nested_path)
 
-        assert result == str(Path(project_root).resolve())
+        assert result == resolved_root
         # Should have called exists multiple times while traversing up
-        assert mock_filesystem.exists.call_count > 1
+        assert fake_filesystem.exists.call_count > 1
 
     def test_discover_project_root_outside_any_project(
-        self, mock_filesystem: Mock
+        self, fake_filesystem: FakeFileSystem
     ) -> None:
         """Test project discovery from path outside any project.
 
@@ -840,15 +856,15 @@ artifacts_root: custom-artifacts
         outside_path = "/home/user/documents/random"
 
         # Mock no marker file found anywhere
-        mock_filesystem.exists.return_value = False
+        fake_filesystem.exists.return_value = False
 
-        result = PantheonWorkspace.discover_project_root(mock_filesystem, outside_path)
+        result = PantheonWorkspace.discover_project_root(fake_filesystem, outside_path)
 
         assert result is None
-        mock_filesystem.exists.assert_called()
+        fake_filesystem.exists.assert_called()
 
     def test_discover_project_root_reaches_filesystem_root(
-        self, mock_filesystem: Mock
+        self, fake_filesystem: FakeFileSystem
     ) -> None:
         """Test project discovery when reaching filesystem root without finding marker.
 
@@ -857,13 +873,54 @@ artifacts_root: custom-artifacts
         deep_path = "/very/deep/path/structure/that/has/no/project"
 
         # Mock no marker file found anywhere
-        mock_filesystem.exists.return_value = False
+        fake_filesystem.exists.return_value = False
 
-        result = PantheonWorkspace.discover_project_root(mock_filesystem, deep_path)
+        result = PantheonWorkspace.discover_project_root(fake_filesystem, deep_path)
 
         assert result is None
         # Should have called exists multiple times while traversing to root
-        assert mock_filesystem.exists.call_count > 1
+        assert fake_filesystem.exists.call_count > 1
+
+    def test_discover_project_root_memoizes_visited_directories(
+        self, fake_filesystem: FakeFileSystem
+    ) -> None:
+        """Test repeated discovery reuses the ancestors probed by earlier walks.
+
+        Tests a second discovery from a sibling directory stops at the first
+        memoized ancestor instead of probing up to the project root again.
+        """
+        project_root = "/test/project"
+        resolved_root = str(Path(project_root).resolve())
+        expected_marker = str(Path(resolved_root) / ".pantheon_project")
+
+        fake_filesystem.exists.side_effect = lambda path: str(path) == expected_marker
+
+        first = PantheonWorkspace.discover_project_root(
+            fake_filesystem, "/test/project/src/components"
+        )
+        probes_after_first = fake_filesystem.exists.call_count
+
+        second = PantheonWorkspace.discover_project_root(
+            fake_filesystem, "/test/project/src/utils"
+        )
+
+        assert first == second == resolved_root
+        # Only the unvisited sibling directory needs probing on the second walk
+        assert fake_filesystem.exists.call_count == probes_after_first + 1
+
+    def test_discover_project_root_cache_can_be_cleared(
+        self, fake_filesystem: FakeFileSystem
+    ) -> None:
+        """Test clear_discovery_cache forces the next discovery to walk again."""
+        fake_filesystem.exists.return_value = False
+
+        assert PantheonWorkspace.discover_project_root(fake_filesystem, "/a/b") is None
+        probes_after_first = fake_filesystem.exists.call_count
+
+        clear_discovery_cache()
+        assert PantheonWorkspace.discover_project_root(fake_filesystem, "/a/b") is None
+
+        assert fake_filesystem.exists.call_count == 2 * probes_after_first
 
     # Phase 1 Comprehensive Tests - Save Artifact Tests
 
@@ -876,17 +933,20 @@ artifacts_root: custom-artifacts
         """
         content = "Test content"
         artifact_path = PantheonPath("nested/deep/structure/artifact.txt")
-
-        # Mock parent doesn't exist initially, then exists after mkdir
-        mock_filesystem.exists.side_effect = [False, True]
+        probes = mock_filesystem.exists.call_count
 
         result = workspace.save_artifact(content, artifact_path)
 
+        # Parent creation is unconditional and idempotent, with no existence probe
         mock_filesystem.mkdir.assert_called_once()
+        assert mock_filesystem.mkdir.call_args.kwargs == {
+            "parents": True,
+            "exist_ok": True,
+        }
+        assert mock_filesystem.exists.call_count == probes
         mock_filesystem.write_text.assert_called_once()
-        from pathlib import Path
 
-        assert Path(str(result)).as_posix() == "nested/deep/structure/artifact.txt"
+        assert str(result) == "nested/deep/structure/artifact.txt"
 
     def test_save_artifact_overwrite_existing_file(
         self, workspace: PantheonWorkspace, mock_filesystem: Mock
@@ -898,17 +958,14 @@ artifacts_root: custom-artifacts
         content = "Updated content"
         artifact_path = PantheonPath("existing/artifact.txt")
 
-        # Mock parent directory and file both exist
-        mock_filesystem.exists.return_value = True
-
         result = workspace.save_artifact(content, artifact_path)
 
-        # Should not try to create directory since it exists
-        mock_filesystem.mkdir.assert_not_called()
+        # mkdir with exist_ok=True is a no-op for an existing parent directory
+        mock_filesystem.mkdir.assert_called_once()
+        assert mock_filesystem.mkdir.call_args.kwargs["exist_ok"] is True
         mock_filesystem.write_text.assert_called_once()
-        from pathlib import Path
 
-        assert Path(str(result)).as_posix() == "existing/artifact.txt"
+        assert str(result) == "existing/artifact.txt"
 
     def test_save_artifact_permission_error(
         self, workspace: PantheonWorkspace, mock_filesystem: Mock
@@ -957,9 +1014,8 @@ artifacts_root: custom-artifacts
         result = workspace.save_artifact(content, artifact_path)
 
         assert result == artifact_path
-        from pathlib import Path
 
-        assert Path(str(result)).as_posix() == "correct/relative/path.txt"
+        assert str(result) == "correct/relative/path.txt"
 
     # Phase 1 Comprehensive Tests - Create Tempfile Tests
 
@@ -981,8 +1037,6 @@ artifacts_root: custom-artifacts
         assert filename.endswith(".yaml")
 
         # Use pathlib for cross-platform path checking
-        from pathlib import Path
-
         actual_path = Path(str(result))
         assert "temp" in actual_path.parts
 
@@ -1091,6 +1145,41 @@ artifacts_root: output
         # Should convert to string or handle appropriately
         assert result["artifacts_root"] == "output"
 
+    def test_load_project_config_memoizes_parsed_config(
+        self, mock_filesystem: Mock
+    ) -> None:
+        """Test repeated config loads parse the YAML once and return copies.
+
+        Tests callers can mutate their result without affecting later loads.
+        """
+        mock_filesystem.exists.return_value = True
+        mock_filesystem.read_text.return_value = "active_team: frontend\n"
+
+        first = PantheonWorkspace.load_project_config(mock_filesystem, "/test/project")
+        first["active_team"] = "mutated"
+        second = PantheonWorkspace.load_project_config(mock_filesystem, "/test/project")
+
+        assert second["active_team"] == "frontend"
+        mock_filesystem.read_text.assert_called_once()
+
+        invalidate_project_config(mock_filesystem)
+        PantheonWorkspace.load_project_config(mock_filesystem, "/test/project")
+
+        assert mock_filesystem.read_text.call_count == 2
+
+    def test_load_project_config_does_not_memoize_defaults(
+        self, mock_filesystem: Mock
+    ) -> None:
+        """Test a missing config file is re-checked so a later file is picked up."""
+        mock_filesystem.exists.return_value = False
+        PantheonWorkspace.load_project_config(mock_filesystem, "/test/project")
+
+        mock_filesystem.exists.return_value = True
+        mock_filesystem.read_text.return_value = "active_team: frontend\n"
+        result = PantheonWorkspace.load_project_config(mock_filesystem, "/test/project")
+
+        assert result["active_team"] == "frontend"
+
     def test_has_process_redirect_with_redirect_file(
         self, workspace: PantheonWorkspace, mock_filesystem: Mock
     ) -> None:
@@ -1389,6 +1478,67 @@ class TestRoutineTemplateRendering:
         # Should contain the raw template content, not rendered
         assert "{{ unclosed_variable }}" in rendered_content
 
+    def test_simple_routine_template_skips_jinja(
+        self,
+        workspace: PantheonWorkspace,
+        mock_filesystem: Mock,
+        routine_template_content: str,
+    ) -> None:
+        """Test placeholder-only routine templates are rendered without Jinja."""
+        target_path = PantheonPath("test", "create-ticket", "routine.md")
+        mock_filesystem.read_bundled_resource.return_value = routine_template_content
+
+        with patch("pantheon.artifact_engine.ArtifactEngine") as mock_engine:
+            workspace.copy_default_create_routine(
+                target_path, {"artifact": "ticket", "pantheon_actor": "ticket-agent"}
+            )
+
+        mock_engine.assert_not_called()
+        rendered_content = mock_filesystem.write_text.call_args[0][1]
+        assert rendered_content == (
+            "# Routine: create-ticket\n\n**Actor:** ticket-agent\n\n"
+            "Step 1. Get schema for ticket"
+        )
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "{% if artifact %}{{ artifact }}{% endif %}",
+            "{# note #}{{ artifact }}",
+            "{{ artifact|upper }}",
+            "{{ section.name }}",
+            "{{ invalid",
+        ],
+        ids=["block", "comment", "filter", "attribute", "unclosed"],
+    )
+    def test_render_simple_defers_non_trivial_templates(self, template: str) -> None:
+        """Test _render_simple leaves anything beyond bare placeholders to Jinja."""
+        assert _render_simple(template, {"artifact": "ticket"}) is None
+
+    def test_render_simple_defers_undefined_placeholders(self) -> None:
+        """Test unknown placeholders go to Jinja so undefined warnings are kept."""
+        rendered = _render_simple("{{artifact}}: {{ missing }}", {"artifact": "ticket"})
+
+        assert rendered is None
+
+    def test_render_simple_normalizes_newlines_like_the_engine(self) -> None:
+        """Test the fast path collapses blank-line runs as render_template does."""
+        rendered = _render_simple("{{ artifact }}\n\n\n\nend", {"artifact": "ticket"})
+
+        assert rendered == "ticket\n\nend"
+
+    def test_routine_template_syntax_error_falls_back_to_raw_template(
+        self, workspace: PantheonWorkspace, mock_filesystem: Mock
+    ) -> None:
+        """Test a routine template with invalid syntax is written unrendered."""
+        invalid_template = "# Routine: {% if artifact %}{{ artifact }}"
+        target_path = PantheonPath("test", "create-ticket", "routine.md")
+        mock_filesystem.read_bundled_resource.return_value = invalid_template
+
+        workspace.copy_default_create_routine(target_path, {"artifact": "ticket"})
+
+        assert mock_filesystem.write_text.call_args[0][1] == invalid_template
+
     def test_routine_template_without_enhanced_parameters(
         self, workspace: PantheonWorkspace, mock_filesystem: Mock
     ) -> None:
@@ -1446,15 +1596,19 @@ class TestRoutineTemplateRendering:
             "pantheon", "_templates/routines/create-process-routine.md"
         )
 
-        # Find the routine.md write call
-        routine_write_call = None
-        for call in mock_filesystem.write_text.call_args_list:
-            if "routine.md" in str(call[0][0]):
-                routine_write_call = call
-                break
+        # All files are written in a single batch
+        mock_filesystem.write_many.assert_called_once()
+        mock_filesystem.write_text.assert_not_called()
+        written = dict(mock_filesystem.write_many.call_args[0][0])
+        assert len(written) == len(paths)
 
-        assert routine_write_call is not None
-        rendered_content = routine_write_call[0][1]
+        # Find the routine.md write entry
+        routine_entries = [
+            content for path, content in written.items() if path.name == "routine.md"
+        ]
+
+        assert len(routine_entries) == 1
+        rendered_content = routine_entries[0]
         assert "create-ticket" in rendered_content
         assert "{{ artifact }}" not in rendered_content
 
@@ -1492,6 +1646,68 @@ class TestRoutineTemplateRendering:
         assert env.lstrip_blocks is True
         assert env.keep_trailing_newline is True
 
+    def test_get_artifact_template_environment_is_cached_per_team_and_process(
+        self,
+    ):
+        """Test template environments are reused until the team or process changes."""
+        workspace = PantheonWorkspace("/test/project", "/test/artifacts", Mock())
+        workspace._project_config = {"active_team": "test-team"}
+
+        env = workspace.get_artifact_template_environment("test-process")
+
+        assert workspace.get_artifact_template_environment("test-process") is env
+        other_process_env = workspace.get_artifact_template_environment("other-process")
+        assert other_process_env is not env
+        # Per-process environments are overlays with their own copy of the filters
+        assert other_process_env.filters == env.filters
+        assert other_process_env.filters is not env.filters
+        assert other_process_env.loader is not env.loader
+
+        workspace._project_config = {"active_team": "other-team"}
+        other_team_env = workspace.get_artifact_template_environment("test-process")
+        assert other_team_env is not env
+        assert "other-team" in str(other_team_env.loader.searchpath[0])
+
+        workspace.clear_template_env_cache()
+        workspace._project_config = {"active_team": "test-team"}
+        assert workspace.get_artifact_template_environment("test-process") is not env
+
+    def test_rendering_does_not_leak_filters_into_shared_environments(self):
+        """Test per-render filters stay on the process overlay they were set on."""
+        from pantheon.artifact_engine import ArtifactEngine
+
+        workspace = PantheonWorkspace("/test/project", "/test/artifacts", Mock())
+        workspace._project_config = {"active_team": "test-team"}
+        engine = ArtifactEngine(workspace=workspace)
+
+        for process_name in ("create-ticket", "update-plan"):
+            env = workspace.get_artifact_template_environment(process_name)
+            rendered = engine.render_artifact_template(
+                "{{ title }}", {"title": process_name}, env
+            )
+            assert rendered == process_name
+
+        base_env = workspace._template_base_env
+        assert base_env is not None
+        assert "to_yaml" not in base_env.filters
+
+    def test_copy_gets_own_config_and_empty_caches(self):
+        """Test copy.copy shares roots and read-only config but not memoized state."""
+        workspace = PantheonWorkspace("/test/project", "/test/artifacts", Mock())
+        workspace._project_config = {"active_team": "test-team"}
+        env = workspace.get_artifact_template_environment("test-process")
+        workspace._redirect_cache[("test-team", "test-process")] = True
+
+        clone = copy.copy(workspace)
+        clone._filesystem = Mock()
+
+        assert clone._project_root == workspace._project_root
+        assert clone._project_config == workspace._project_config
+        assert clone._get_active_team_root() == workspace._get_active_team_root()
+        assert clone._redirect_cache == {}
+        assert clone.get_artifact_template_environment("test-process") is not env
+        assert workspace.get_artifact_template_environment("test-process") is env
+
     def test_has_artifact_parser_returns_true_when_exists(self):
         """Test has_artifact_parser returns True when parser.jsonnet exists."""
         mock_filesystem = Mock()
@@ -1539,3 +1755,30 @@ class TestRoutineTemplateRendering:
         assert "test-team" in str(call_args)
         assert "get-architecture-guide" in str(call_args)
         assert "parser.jsonnet" in str(call_args)
+
+    def test_process_existence_checks_are_memoized_per_team(
+        self, workspace: PantheonWorkspace, mock_filesystem: Mock
+    ) -> None:
+        """Test redirect/parser checks hit the filesystem once per team and process."""
+        workspace._project_config = {"active_team": "test-team"}
+        mock_filesystem.exists.return_value = True
+        # Probes made while constructing the workspace are not counted
+        probes = mock_filesystem.exists.call_count
+
+        assert workspace.has_artifact_parser("get-ticket") is True
+        assert workspace.has_process_redirect("get-ticket") is True
+        mock_filesystem.exists.return_value = False
+        assert workspace.has_artifact_parser("get-ticket") is True
+        assert workspace.has_process_redirect("get-ticket") is True
+        assert mock_filesystem.exists.call_count == probes + 2
+
+        # A different team misses the cache
+        workspace._project_config = {"active_team": "other-team"}
+        assert workspace.has_artifact_parser("get-ticket") is False
+        assert mock_filesystem.exists.call_count == probes + 3
+
+        # Explicit invalidation forces a fresh probe
+        workspace._project_config = {"active_team": "test-team"}
+        workspace.invalidate_process_caches()
+        assert workspace.has_process_redirect("get-ticket") is False
+        assert mock_filesystem.exists.call_count == probes + 4
@@ -7,6 +7,7 @@ path construction, content retrieval, and error handling.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from unittest.mock import Mock
 
 import pytest
@@ -27,6 +28,18 @@ class TestWorkspaceArtifactTemplateUri:
         """
         return Mock(spec=FileSystem)
 
+    @pytest.fixture
+    def make_filesystem(self) -> Callable[[], Mock]:
+        """Provide a factory for fresh mock FileSystems.
+
+        Tests that need a clean mock per loop step build a new one instead of
+        calling reset_mock(), which walks every child mock.
+
+        Returns:
+            Callable returning a new Mock FileSystem with spec
+        """
+        return lambda: Mock(spec=FileSystem)
+
     @pytest.fixture
     def sample_paths(self) -> dict[str, str]:
         """Create sample path instances for testing.
@@ -272,7 +285,7 @@ class TestWorkspaceArtifactTemplateUri:
     def test_artifact_template_uri_with_multiple_processes(
         self,
         workspace_with_config: PantheonWorkspace,
-        mock_filesystem: Mock,
+        make_filesystem: Callable[[], Mock],
     ) -> None:
         """Test artifact-template:// URIs work for different processes.
 
@@ -296,13 +309,14 @@ class TestWorkspaceArtifactTemplateUri:
         ]
 
         for uri, expected_content in test_cases:
-            # Arrange: Reset mock and configure response
-            mock_filesystem.reset_mock()
-            mock_filesystem.read_text.return_value = expected_content
+            # Arrange: Fresh filesystem configured with this response
+            filesystem = make_filesystem()
+            filesystem.read_text.return_value = expected_content
+            workspace_with_config._filesystem = filesystem
 
             # Act: Resolve URI
             result = workspace_with_config.get_resolved_content(uri)
 
             # Assert: Verify correct content
             assert result == expected_content
-            mock_filesystem.read_text.assert_called_once()
+            filesystem.read_text.assert_called_once()
@@ -7,61 +7,121 @@ where source is isolated but artifacts are shared, following T015 security requi
 
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import Mock
+from collections.abc import Mapping
+import platform
+from types import MappingProxyType
 
 import pytest
 
-from pantheon.filesystem import FileSystem
 from pantheon.path import PantheonPath
 from pantheon.workspace import PantheonWorkspace, ProjectConfig, SecurityError
+from tests.helpers.mem_filesystem import MemFileSystem
 
 # Function removed - using proper pathlib operations instead
 
 
-class TestPantheonWorkspaceSecurity:
-    """Test suite for PantheonWorkspace security and sandboxing validation."""
+# Host platform, resolved once; absolute-path examples depend on it
+_IS_WINDOWS = platform.system() == "Windows"
 
-    @pytest.fixture
-    def mock_filesystem(self) -> Mock:
-        """Create a mock FileSystem for dependency injection.
+# Absolute paths PantheonPath must refuse on the host platform
+_ABSOLUTE_PATHS: tuple[str, ...] = (
+    (
+        "C:\\etc\\passwd",
+        "C:\\Windows\\System32\\config",
+        "D:\\root\\.ssh\\id_rsa",
+        "C:\\absolute\\windows\\path",
+        "D:\\another\\absolute\\path",
+        "\\\\network\\share\\path",
+    )
+    if _IS_WINDOWS
+    else (
+        "/etc/passwd",
+        "/home/user/.ssh/id_rsa",
+        "/var/log/system.log",
+        "/home/user/file",
+        "/absolute/unix/path",
+    )
+)
+
+# Safe relative paths that every workspace write should accept
+_SAFE_RELATIVE_PATHS: tuple[str, ...] = (
+    "safe/relative/path.txt",
+    "documents/file.md",
+    "nested/directory/structure/file.json",
+    "simple-file.txt",
+    "file_with_underscores.yaml",
+    "file.with.dots.txt",
+    "123-numeric-prefix.txt",
+    "UPPERCASE_FILE.TXT",
+    "mixed-Case_File.123",
+)
+
+
+def _assert_in_team(path: str | None, team: str) -> None:
+    """Assert a read path lies in the given team's package and no other team's.
+
+    The path is normalized to forward slashes once and checked with substring
+    scans against slash-delimited components, without building a Path.
+    """
+    wrapped = "/" + str(path).replace("\\", "/") + "/"
+    assert "/pantheon-teams/" in wrapped, wrapped
+    assert f"/{team}/" in wrapped, wrapped
+    other = "team-b" if team == "team-a" else "team-a"
+    assert f"/{other}/" not in wrapped, wrapped
+
+
+@pytest.fixture(scope="session")
+def malicious_paths() -> Mapping[str, str]:
+    """Create malicious path examples for security testing.
+
+    Returns:
+        Read-only mapping of attack types to malicious path strings
+    """
+    return MappingProxyType(
+        {
+            "basic_traversal": "../../../etc/passwd",
+            "windows_traversal": "..\\..\\..\\Windows\\System32\\config",
+            "encoded_traversal": "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",
+            "double_encoded": "%252e%252e%252f%252e%252e%252f%252e%252e%252fetc%252fpasswd",
+            "unicode_traversal": "..\u002e\u002f..\u002e\u002f..\u002e\u002fetc\u002fpasswd",
+            "mixed_separators": "../..\\..\\etc/passwd",
+            "multiple_traversal": "../../../../../../../../etc/passwd",
+            "traversal_with_nulls": "../../../etc/passwd\x00.txt",
+            "relative_absolute": "./../../etc/passwd",
+            "current_dir_traversal": "./../../../etc/passwd",
+        }
+    )
 
-        Returns:
-            Mock FileSystem with spec to ensure proper interface usage
-        """
-        return Mock(spec=FileSystem)
+
+class TestPantheonWorkspaceSecurity:
+    """Test suite for PantheonWorkspace security and sandboxing validation."""
 
     @pytest.fixture
-    def sample_paths(self) -> dict[str, str]:
-        """Create sample path instances for testing.
+    def mem_filesystem(self) -> MemFileSystem:
+        """Create an empty in-memory FileSystem for dependency injection.
 
         Returns:
-            Dictionary of named path instances for test scenarios
+            MemFileSystem with no files or directories
         """
-        return {
-            "project_root_str": "/test/project",
-            "artifacts_root_str": "/test/project/pantheon-artifacts",
-        }
+        return MemFileSystem()
 
     @pytest.fixture
     def workspace_team_a(
-        self, mock_filesystem: Mock, sample_paths: dict[str, str]
+        self, mem_filesystem: MemFileSystem, sample_paths: Mapping[str, str]
     ) -> PantheonWorkspace:
         """Create workspace configured for team-a.
 
         Args:
-            mock_filesystem: Mocked FileSystem dependency
+            mem_filesystem: In-memory FileSystem dependency
             sample_paths: Sample path instances
 
         Returns:
             PantheonWorkspace configured with team-a as active team
         """
-        mock_filesystem.exists.return_value = False
-
         workspace = PantheonWorkspace(
             project_root=sample_paths["project_root_str"],
             artifacts_root=sample_paths["artifacts_root_str"],
-            filesystem=mock_filesystem,
+            filesystem=mem_filesystem,
         )
 
         workspace._project_config = ProjectConfig(
@@ -72,23 +132,21 @@ class TestPantheonWorkspaceSecurity:
 
     @pytest.fixture
     def workspace_team_b(
-        self, mock_filesystem: Mock, sample_paths: dict[str, str]
+        self, mem_filesystem: MemFileSystem, sample_paths: Mapping[str, str]
     ) -> PantheonWorkspace:
         """Create workspace configured for team-b.
 
         Args:
-            mock_filesystem: Mocked FileSystem dependency
+            mem_filesystem: In-memory FileSystem dependency
             sample_paths: Sample path instances
 
         Returns:
             PantheonWorkspace configured with team-b as active team
         """
-        mock_filesystem.exists.return_value = False
-
         workspace = PantheonWorkspace(
             project_root=sample_paths["project_root_str"],
             artifacts_root=sample_paths["artifacts_root_str"],
-            filesystem=mock_filesystem,
+            filesystem=mem_filesystem,
         )
 
         workspace._project_config = ProjectConfig(
@@ -97,45 +155,6 @@ class TestPantheonWorkspaceSecurity:
 
         return workspace
 
-    @pytest.fixture
-    def malicious_paths(self) -> dict[str, str]:
-        """Create malicious path examples for security testing.
-
-        Returns:
-            Dictionary mapping attack types to malicious path strings
-        """
-        return {
-            "basic_traversal": "../../../etc/passwd",
-            "windows_traversal": "..\\..\\..\\Windows\\System32\\config",
-            "encoded_traversal": "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",
-            "double_encoded": "%252e%252e%252f%252e%252e%252f%252e%252e%252fetc%252fpasswd",
-            "unicode_traversal": "..\u002e\u002f..\u002e\u002f..\u002e\u002fetc\u002fpasswd",
-            "mixed_separators": "../..\\..\\etc/passwd",
-            "multiple_traversal": "../../../../../../../../etc/passwd",
-            "traversal_with_nulls": "../../../etc/passwd\x00.txt",
-            "relative_absolute": "./../../etc/passwd",
-            "current_dir_traversal": "./../../../etc/passwd",
-        }
-
-    @pytest.fixture
-    def safe_relative_paths(self) -> list[str]:
-        """Create safe relative path examples.
-
-        Returns:
-            List of safe relative paths that should be allowed
-        """
-        return [
-            "safe/relative/path.txt",
-            "documents/file.md",
-            "nested/directory/structure/file.json",
-            "simple-file.txt",
-            "file_with_underscores.yaml",
-            "file.with.dots.txt",
-            "123-numeric-prefix.txt",
-            "UPPERCASE_FILE.TXT",
-            "mixed-Case_File.123",
-        ]
-
     # Path Security Validation Tests
 
     @pytest.mark.parametrize(
@@ -168,16 +187,11 @@ class TestPantheonWorkspaceSecurity:
         Verifies that absolute paths cannot be created as PantheonPath objects,
         maintaining the T015 security constraint at the type level.
         """
-        import os
-
-        # Use one platform-appropriate absolute path
-        absolute_path = "C:\\temp" if os.name == "nt" else "/tmp"
-
         with pytest.raises(ValueError, match="must represent a relative path"):
-            PantheonPath(absolute_path)
+            PantheonPath(_ABSOLUTE_PATHS[0])
 
     def test_validate_path_security_handles_encoded_traversal_attempts(
-        self, workspace_team_a: PantheonWorkspace, malicious_paths: dict[str, str]
+        self, workspace_team_a: PantheonWorkspace, malicious_paths: Mapping[str, str]
     ) -> None:
         """Test _validate_path_security catches URL-encoded traversal attempts.
 
@@ -208,7 +222,7 @@ class TestPantheonWorkspaceSecurity:
         workspace_team_a._validate_path_security(safe_path)  # Should not raise
 
     def test_validate_path_security_blocks_embedded_nulls(
-        self, workspace_team_a: PantheonWorkspace, malicious_paths: dict[str, str]
+        self, workspace_team_a: PantheonWorkspace, malicious_paths: Mapping[str, str]
     ) -> None:
         """Test _validate_path_security handles paths with embedded nulls.
 
@@ -251,7 +265,7 @@ class TestPantheonWorkspaceSecurity:
     def test_active_team_cannot_read_other_team_process_files(
         self,
         workspace_team_a: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
     ) -> None:
         """Test team-a cannot read team-b process files.
 
@@ -261,59 +275,45 @@ class TestPantheonWorkspaceSecurity:
         # through normal API since paths are constructed relative to active team
 
         # Verify that get_process_schema constructs paths within team-a
-        mock_filesystem.read_text.return_value = "schema content"
+        mem_filesystem.default_text = "schema content"
 
         result = workspace_team_a.get_process_schema("some-process")
 
         assert result == "schema content"
-        call_args = mock_filesystem.read_text.call_args[0][0]
-        actual_path = Path(str(call_args))
-        assert "pantheon-teams" in actual_path.parts
-        assert "team-a" in actual_path.parts
-        assert "team-b" not in actual_path.parts
+        _assert_in_team(mem_filesystem.last_read, "team-a")
 
     def test_active_team_can_only_access_own_processes(
         self,
         workspace_team_a: PantheonWorkspace,
         workspace_team_b: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
     ) -> None:
         """Test active team can only access processes in own team directory.
 
         Tests team boundary enforcement through path construction validation.
         """
-        mock_filesystem.read_text.return_value = "team content"
+        mem_filesystem.default_text = "team content"
 
         # Team A access
         result_a = workspace_team_a.get_process_schema("test-process")
-        call_args_a = mock_filesystem.read_text.call_args[0][0]
-        path_str_a = str(call_args_a)
-
-        # Reset mock for Team B
-        mock_filesystem.reset_mock()
-        mock_filesystem.read_text.return_value = "team content"
+        path_str_a = mem_filesystem.last_read
 
         # Team B access
         result_b = workspace_team_b.get_process_schema("test-process")
-        call_args_b = mock_filesystem.read_text.call_args[0][0]
-        path_str_b = str(call_args_b)
+        path_str_b = mem_filesystem.last_read
 
         # Both get content but from their respective team directories
         assert result_a == "team content"
         assert result_b == "team content"
-        actual_path_a = Path(str(call_args_a))
-        assert "pantheon-teams" in actual_path_a.parts
-        assert "team-a" in actual_path_a.parts
-        actual_path_b = Path(str(call_args_b))
-        assert "pantheon-teams" in actual_path_b.parts
-        assert "team-b" in actual_path_b.parts
+        _assert_in_team(path_str_a, "team-a")
+        _assert_in_team(path_str_b, "team-b")
         assert path_str_a != path_str_b  # Different paths for different teams
 
     def test_shared_artifacts_root_accessible_to_all_teams(
         self,
         workspace_team_a: PantheonWorkspace,
         workspace_team_b: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
     ) -> None:
         """Test shared artifacts root is accessible to all teams.
 
@@ -323,19 +323,16 @@ class TestPantheonWorkspaceSecurity:
         artifact_path = PantheonPath("shared/output.txt")
         content = "shared artifact content"
 
-        # Mock directory doesn't exist initially
-        mock_filesystem.exists.return_value = True
-
         # Both teams should be able to save to artifacts root
         result_a = workspace_team_a.save_artifact(content, artifact_path)
-        mock_filesystem.reset_mock()
-        mock_filesystem.exists.return_value = True
-
         result_b = workspace_team_b.save_artifact(content, artifact_path)
 
         # Both should succeed and save to the same artifacts area
-        assert Path(str(result_a)).as_posix() == "shared/output.txt"
-        assert Path(str(result_b)).as_posix() == "shared/output.txt"
+        assert str(result_a) == "shared/output.txt"
+        assert str(result_b) == "shared/output.txt"
+        written = {path for path, _ in mem_filesystem.writes}
+        expected = workspace_team_a._artifacts_root / "shared" / "output.txt"
+        assert written == {expected.as_posix()}
 
     def test_security_error_includes_clear_message_for_boundary_violations(
         self, workspace_team_a: PantheonWorkspace
@@ -355,42 +352,37 @@ class TestPantheonWorkspaceSecurity:
             "../" in error_message or "..\\" in error_message
         )  # Should include the problematic pattern
 
+    @pytest.mark.parametrize(
+        "method_name",
+        [
+            "get_process_schema",
+            "get_process_routine",
+            "get_artifact_locator",
+            "get_permissions",
+        ],
+    )
     def test_team_boundary_enforcement_in_content_retrieval_methods(
         self,
         workspace_team_a: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
+        method_name: str,
     ) -> None:
-        """Test boundary enforcement in all content-retrieval methods.
+        """Test boundary enforcement in content-retrieval methods.
 
-        Tests all content-retrieval methods construct paths within team boundaries.
+        Tests each content-retrieval method constructs paths within team boundaries.
         """
-        mock_filesystem.read_text.return_value = "content"
-
-        # Test multiple content methods
-        content_methods = [
-            ("get_process_schema", "test-process"),
-            ("get_process_routine", "test-process"),
-            ("get_artifact_locator", "test-process"),
-            ("get_permissions", "test-process"),
-        ]
+        mem_filesystem.default_text = "content"
 
-        for method_name, process_name in content_methods:
-            method = getattr(workspace_team_a, method_name)
-            method(process_name)
+        getattr(workspace_team_a, method_name)("test-process")
 
-            call_args = mock_filesystem.read_text.call_args[0][0]
-            actual_path = Path(str(call_args))
-            assert "pantheon-teams" in actual_path.parts
-            assert "team-a" in actual_path.parts
-            mock_filesystem.reset_mock()
-            mock_filesystem.read_text.return_value = "content"
+        _assert_in_team(mem_filesystem.last_read, "team-a")
 
     # Save Artifact Security Tests
 
     def test_save_artifact_paths_cannot_escape_artifacts_root(
         self,
         workspace_team_a: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
     ) -> None:
         """Test save_artifact paths cannot escape artifacts_root sandbox.
 
@@ -412,37 +404,10 @@ class TestPantheonWorkspaceSecurity:
             with pytest.raises(SecurityError, match="Directory traversal not allowed"):
                 workspace_team_a.save_artifact(content, pantheon_path)
 
-    def test_save_artifact_rejects_absolute_paths_through_pantheon_path(
-        self,
-        workspace_team_a: PantheonWorkspace,
-    ) -> None:
-        """Test save_artifact rejects absolute paths via PantheonPath validation.
-
-        Tests absolute paths are rejected at PantheonPath construction level.
-        """
-        import platform
-
-        if platform.system() == "Windows":
-            absolute_paths = [
-                "C:\\etc\\passwd",
-                "C:\\Windows\\System32\\config",
-                "D:\\root\\.ssh\\id_rsa",
-            ]
-        else:
-            absolute_paths = [
-                "/etc/passwd",
-                "/home/user/.ssh/id_rsa",
-                "/var/log/system.log",
-            ]
-
-        for abs_path in absolute_paths:
-            with pytest.raises(ValueError, match="must represent a relative path"):
-                PantheonPath(abs_path)
-
     def test_save_artifact_nested_directory_creation_stays_in_sandbox(
         self,
         workspace_team_a: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
     ) -> None:
         """Test save_artifact nested directory creation stays within sandbox.
 
@@ -451,9 +416,6 @@ class TestPantheonWorkspaceSecurity:
         nested_path = PantheonPath("deep/nested/structure/artifact.txt")
         content = "nested content"
 
-        # Mock parent doesn't exist initially
-        mock_filesystem.exists.return_value = False
-
         result = workspace_team_a.save_artifact(content, nested_path)
 
         # Verify path stays relative and within sandbox
@@ -461,31 +423,32 @@ class TestPantheonWorkspaceSecurity:
         assert not str(result).startswith("/")  # Not absolute
         assert ".." not in str(result)  # No traversal
 
-        # Verify mkdir was called for parent creation
-        mock_filesystem.mkdir.assert_called_once()
+        # Verify the parent directory was created inside the artifacts root
+        expected_dir = (
+            workspace_team_a._artifacts_root / "deep" / "nested" / "structure"
+        )
+        assert expected_dir.as_posix() in mem_filesystem.dirs
 
+    @pytest.mark.parametrize("safe_path_str", _SAFE_RELATIVE_PATHS)
     def test_save_artifact_handles_safe_paths_with_various_patterns(
         self,
         workspace_team_a: PantheonWorkspace,
-        mock_filesystem: Mock,
-        safe_relative_paths: list[str],
+        mem_filesystem: MemFileSystem,
+        safe_path_str: str,
     ) -> None:
         """Test save_artifact handles safe paths with various naming patterns.
 
         Tests artifact saving works correctly with various safe filename patterns.
         """
         content = "safe content"
-        mock_filesystem.exists.return_value = True
+        safe_path = PantheonPath(safe_path_str)
 
-        for safe_path_str in safe_relative_paths:
-            safe_path = PantheonPath(safe_path_str)
-
-            result = workspace_team_a.save_artifact(content, safe_path)
+        result = workspace_team_a.save_artifact(content, safe_path)
 
-            assert str(result).replace("\\", "/") == safe_path_str
-            assert not str(result).startswith("/")
-            mock_filesystem.reset_mock()
-            mock_filesystem.exists.return_value = True
+        assert str(result).replace("\\", "/") == safe_path_str
+        assert not str(result).startswith("/")
+        expected = workspace_team_a._artifacts_root / safe_path_str
+        assert mem_filesystem.writes == [(expected.as_posix(), content)]
 
     # PantheonPath Security Integration Tests
 
@@ -494,77 +457,56 @@ class TestPantheonWorkspaceSecurity:
 
         Tests the fundamental T015 security constraint implemented at type level.
         """
-        import platform
-
-        if platform.system() == "Windows":
-            absolute_paths = [
-                "C:\\absolute\\windows\\path",
-                "\\\\network\\share\\path",
-                "D:\\another\\absolute\\path",
-            ]
-        else:
-            absolute_paths = [
-                "/absolute/unix/path",
-                "/etc/passwd",
-                "/home/user/file",
-            ]
-
-        for abs_path in absolute_paths:
+        for abs_path in _ABSOLUTE_PATHS:
             with pytest.raises(ValueError, match="must represent a relative path"):
                 PantheonPath(abs_path)
 
-    def test_pantheon_path_allows_all_relative_paths(self) -> None:
-        """Test PantheonPath allows all relative paths as intended.
-
-        Tests relative paths of various formats are accepted by PantheonPath.
-        """
-        relative_paths = [
+    @pytest.mark.parametrize(
+        "rel_path",
+        [
             "simple.txt",
             "relative/path.txt",
             "nested/deep/structure/file.json",
             "file-with-hyphens.txt",
             "file_with_underscores.yaml",
             "123-numeric-start.txt",
-        ]
-
-        for rel_path in relative_paths:
-            # Should not raise any exception
-            path = PantheonPath(rel_path)
-            assert Path(str(path)).as_posix() == rel_path
-
-    def test_pantheon_path_handles_edge_case_relative_paths(self) -> None:
-        """Test PantheonPath handles suspicious but safe relative paths.
+        ],
+    )
+    def test_pantheon_path_allows_all_relative_paths(self, rel_path: str) -> None:
+        """Test PantheonPath allows all relative paths as intended.
 
-        Tests edge cases that might look suspicious but are actually safe relative paths.
+        Tests relative paths of various formats are accepted by PantheonPath.
         """
-        edge_case_paths = [
+        # Should not raise any exception; str() already uses forward slashes
+        assert str(PantheonPath(rel_path)) == rel_path
+
+    @pytest.mark.parametrize(
+        "edge_path",
+        [
             "file.txt",  # Simple file in current directory
             "a/b/c/d/e/f/g.txt",  # Very deep nesting (but relative)
             "file.with.many.dots.txt",  # Multiple dots in name
             "123",  # Numeric filename
             "ALLCAPS.TXT",  # All uppercase
-        ]
+        ],
+    )
+    def test_pantheon_path_handles_edge_case_relative_paths(
+        self, edge_path: str
+    ) -> None:
+        """Test PantheonPath handles suspicious but safe relative paths.
 
-        for edge_path in edge_case_paths:
-            # Should not raise any exception
-            path = PantheonPath(edge_path)
-            assert Path(str(path)).as_posix() == edge_path
+        Tests edge cases that might look suspicious but are actually safe relative paths.
+        """
+        # Should not raise any exception
+        assert str(PantheonPath(edge_path)) == edge_path
 
     def test_pantheon_path_error_message_clear_for_absolute_paths(self) -> None:
         """Test PantheonPath provides clear error messages for absolute paths.
 
         Tests error messages help users understand the security constraint.
         """
-        import platform
-
-        absolute_path = (
-            "C:\\absolute\\path\\example"
-            if platform.system() == "Windows"
-            else "/absolute/path/example"
-        )
-
         with pytest.raises(ValueError) as exc_info:
-            PantheonPath(absolute_path)
+            PantheonPath(_ABSOLUTE_PATHS[-1])
 
         error_message = str(exc_info.value)
         assert "must represent a relative path" in error_message
@@ -572,7 +514,7 @@ class TestPantheonWorkspaceSecurity:
     def test_workspace_can_safely_unwrap_pantheon_path(
         self,
         workspace_team_a: PantheonWorkspace,
-        mock_filesystem: Mock,
+        mem_filesystem: MemFileSystem,
     ) -> None:
         """Test workspace can safely unwrap PantheonPath for filesystem operations.
 
@@ -581,12 +523,11 @@ class TestPantheonWorkspaceSecurity:
         """
         safe_path = PantheonPath("safe/relative/path.txt")
         content = "safe content"
-        mock_filesystem.exists.return_value = True
 
         # Workspace should be able to unwrap and use the path safely
         result = workspace_team_a.save_artifact(content, safe_path)
 
         assert result == safe_path
-        mock_filesystem.write_text.assert_called_once()
+        assert len(mem_filesystem.writes) == 1
 
     # Cross-Process Reference Security Tests